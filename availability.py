@@ -0,0 +1,372 @@
+"""
+Court availability engine.
+
+Events are stored as integer minute-of-day intervals in compact arrays keyed
+by (date, court). fetch_availability_data computes free slots for every day
+in the horizon and every court; later runs recompute only the (date, court)
+entries their changes touch (stale_keys, patch_availability_data).
+"""
+import re
+import json
+import time
+import hashlib
+from array import array
+from collections import defaultdict
+from datetime import datetime, timedelta
+import pytz
+from event_parser import parse_time
+import metrics
+
+timezone = pytz.timezone('US/Eastern')
+
+# Operating hours for the facility
+OPERATING_HOURS = {
+    'Monday': ('7am', '11pm'),
+    'Tuesday': ('7am', '11pm'),
+    'Wednesday': ('7am', '11pm'),
+    'Thursday': ('7am', '11pm'),
+    'Friday': ('7am', '8pm'),
+    'Saturday': ('8am', '8pm'),
+    'Sunday': ('8am', '8pm')
+}
+
+# Courts that exist at the facility, used to expand "All courts" locations
+COURT_NUMBERS = (1, 2, 3, 4)
+
+# Court shown on the generated page and kept under the top-level "availability" key
+DISPLAY_COURT = 3
+
+# Days from today that availability is published for
+HORIZON_DAYS = 90
+
+COURT_PATTERN = re.compile(r'(?<!Tennis )Courts? #(\d+)(?:\s*(?:-|to)\s*#?(\d+))?')
+ALL_COURTS_PATTERN = re.compile(r'\bAll (?:Gym )?Courts\b', re.IGNORECASE)
+
+WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+def to_minutes(t):
+    """Convert a datetime.time (or datetime) to minutes since midnight."""
+    return t.hour * 60 + t.minute
+
+def format_minutes(minutes):
+    """Format minutes since midnight like '7am' or '4:30pm'."""
+    hour, minute = divmod(minutes, 60)
+    suffix = 'am' if hour < 12 else 'pm'
+    hour = hour % 12 or 12
+    return f"{hour}{suffix}" if minute == 0 else f"{hour}:{minute:02d}{suffix}"
+
+# Opening and closing minute for each weekday, indexed by date.weekday()
+OPERATING_MINUTES = tuple(
+    (to_minutes(parse_time(OPERATING_HOURS[day][0])), to_minutes(parse_time(OPERATING_HOURS[day][1])))
+    for day in WEEKDAYS
+)
+
+# Display label for every minute of the day
+MINUTE_LABELS = tuple(format_minutes(minutes) for minutes in range(24 * 60))
+
+def extract_courts(location):
+    """
+    Extract the court numbers referenced by a location string.
+
+    Handles single courts ("Court #3"), ranges ("Courts #1-4") and
+    facility-wide bookings ("All Courts").
+
+    Args:
+        location: Location part of a parsed event
+
+    Returns:
+        Tuple of (set of court numbers, True if the location books all courts)
+    """
+    courts = set()
+    for first, last in COURT_PATTERN.findall(location):
+        first = int(first)
+        last = int(last) if last else first
+        courts.update(range(first, last + 1))
+    return courts, bool(ALL_COURTS_PATTERN.search(location))
+
+def booked_courts(location, location_courts=None):
+    """
+    Courts a location books, with facility-wide bookings expanded to every court.
+
+    Args:
+        location: Location part of a parsed event
+        location_courts: Optional dictionary memoizing results per location string
+    """
+    if location_courts is not None and location in location_courts:
+        return location_courts[location]
+    courts, all_courts = extract_courts(location)
+    if all_courts:
+        courts = courts.union(COURT_NUMBERS)
+    if location_courts is not None:
+        location_courts[location] = courts
+    return courts
+
+def event_spans(events_data):
+    """
+    Yield (date, court_number, start_minute, end_minute) for every court each parsed event books.
+    """
+    location_courts = {}
+    for event in events_data:
+        courts = booked_courts(event["location"], location_courts)
+        if not courts:
+            continue
+        start, end = to_minutes(event["start"]), to_minutes(event["end"])
+        for court_number in courts:
+            yield event["date"], court_number, start, end
+
+def index_spans(spans):
+    """
+    Build the event index from (date, court_number, start_minute, end_minute) spans.
+    """
+    intervals = defaultdict(list)
+    for date, court_number, start, end in spans:
+        intervals[(date, court_number)].append((start, end))
+
+    index = {}
+    for key, key_spans in intervals.items():
+        key_spans.sort()
+        index[key] = array('H', [bound for span in key_spans for bound in span])
+    return index
+
+def build_event_index(events_data):
+    """
+    Build a one-time index of parsed events keyed by (date, court number).
+
+    Availability for any day and court then becomes a dictionary lookup plus a merge.
+
+    Args:
+        events_data: List of parsed event dictionaries from event_parser.parse_schedule_data
+
+    Returns:
+        Dictionary mapping (date, court_number) to an array('H') of
+        minute-of-day interval bounds [start, end, start, end, ...], sorted by start
+    """
+    start = time.perf_counter()
+    index = index_spans(event_spans(events_data))
+    metrics.observe("event_index_build_seconds", time.perf_counter() - start)
+    return index
+
+def fetch_events(date, event_index, court_number=3):
+    """
+    Fetch events for the specified date and court number.
+
+    Args:
+        date: The date to check for events
+        event_index: Index built by build_event_index
+        court_number: Court number to filter by (default: 3)
+
+    Returns:
+        array('H') of sorted [start, end, ...] minute bounds for that date and court
+    """
+    return event_index.get((date, court_number), array('H'))
+
+def free_slots(spans, open_minute, close_minute):
+    """
+    Complement of the sorted busy spans within opening hours.
+    Gaps of a minute or less between events are merged away.
+    """
+    slots = []
+    current = open_minute
+    for start, end in zip(spans[0::2], spans[1::2]):
+        # If there's time between the current minute and the event, it is available
+        if current + 1 < start:
+            slots.append((current, start))
+        if end > current:
+            current = end
+
+    # Check if there is available time after the last event until closing time
+    if current < close_minute:
+        slots.append((current, close_minute))
+    return slots
+
+def get_available_times(date, event_index, court_number=3):
+    """
+    Get available time slots for the specified court on the given date.
+
+    Args:
+        date: The date to check for availability
+        event_index: Index built by build_event_index
+        court_number: Court number to check availability for (default: 3)
+
+    Returns:
+        List of (start_minute, end_minute) tuples representing available slots
+    """
+    open_minute, close_minute = OPERATING_MINUTES[date.weekday()]
+    return free_slots(fetch_events(date, event_index, court_number), open_minute, close_minute)
+
+def get_court_numbers(event_index):
+    """
+    Get every court number known to the facility or referenced by an event.
+    """
+    return sorted(set(COURT_NUMBERS).union(court for _, court in event_index))
+
+class DayAvailability:
+    """
+    Free slots per (date, court), computed on first request and memoized.
+
+    Args:
+        event_index: Index built by build_event_index
+        dates: Dates the calendar has data for; other dates are unknown rather than free
+    """
+
+    def __init__(self, event_index, dates):
+        self.event_index = event_index
+        self.dates = frozenset(dates)
+        self.courts = get_court_numbers(event_index)
+        self._slots = {}
+        self._labels = {}
+
+    def slots(self, date, court=DISPLAY_COURT):
+        """List of (start_minute, end_minute) free slots."""
+        key = (date, court)
+        slots = self._slots.get(key)
+        if slots is None:
+            slots = self._slots[key] = get_available_times(date, self.event_index, court)
+        return slots
+
+    def labels(self, date, court=DISPLAY_COURT):
+        """Free slots formatted like '7am - 4:30pm'."""
+        key = (date, court)
+        labels = self._labels.get(key)
+        if labels is None:
+            labels = self._labels[key] = [f"{MINUTE_LABELS[start]} - {MINUTE_LABELS[end]}"
+                                          for start, end in self.slots(date, court)]
+        return labels
+
+def window_dates(dates, start=None, days=None):
+    """
+    Sorted dates in [start, start + days), start defaulting to today; all dates if days is None.
+    """
+    if days is None:
+        return sorted(dates)
+    start = start or datetime.now(timezone).date()
+    end = start + timedelta(days=days)
+    return sorted(date for date in dates if start <= date < end)
+
+def availability_hash(data):
+    """
+    Hash the availability payload, ignoring when it was generated, so unchanged runs can be detected.
+    """
+    content = {key: value for key, value in data.items() if key not in ("last_updated", "content_hash")}
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+def fetch_availability_data(unique_dates, event_index, courts=None, horizon_days=None, start=None):
+    """
+    Compute availability for every court and format it as a JSON structure.
+    Returns a dictionary with per-court availability under "courts" (court number -> date -> slots),
+    plus the display court's availability under "availability" for the generated page.
+
+    Only dates within horizon_days of start (default: today) are computed; all dates if horizon_days is None.
+    """
+    try:
+        day_availability = DayAvailability(event_index, unique_dates)
+        if courts is None:
+            courts = day_availability.courts
+        dates = window_dates(day_availability.dates, start, horizon_days)
+
+        with metrics.timer("availability_compute_seconds"):
+            courts_data = {
+                str(court): {date.isoformat(): day_availability.labels(date, court) for date in dates}
+                for court in courts
+            }
+
+        result = {
+            "availability": courts_data.get(str(DISPLAY_COURT), {}),
+            "courts": courts_data,
+            "last_updated": datetime.now(timezone).strftime("%Y-%m-%d %H:%M:%S")
+        }
+        result["content_hash"] = availability_hash(result)
+
+        return result
+    except Exception as e:
+        print(f"Error generating availability data: {e}")
+        result = {"availability": {}, "courts": {}, "last_updated": datetime.now(timezone).strftime("%Y-%m-%d %H:%M:%S")}
+        result["content_hash"] = availability_hash(result)
+        return result
+
+def stale_keys(previous, dates, courts, affected):
+    """
+    (date, court) entries of availability data that cannot be carried over from a previous run.
+
+    An entry is stale when one of its events was added, removed or changed, or when the previous
+    data does not have it yet - a day that just entered the horizon or a newly referenced court.
+    """
+    previous_courts = previous.get("courts", {})
+    keys = set()
+    for court in courts:
+        previous_days = previous_courts.get(str(court), {})
+        for date in dates:
+            if (date, court) in affected or date.isoformat() not in previous_days:
+                keys.add((date, court))
+    return keys
+
+def patch_availability_data(previous, dates, courts, keys, event_index):
+    """
+    Build availability data by recomputing only the given (date, court) keys and copying the rest from previous.
+
+    Args:
+        previous: Availability data written by a previous run
+        dates: Dates to publish, e.g. from window_dates
+        courts: Courts to publish
+        keys: Stale entries from stale_keys
+        event_index: Event index holding at least the stale keys
+
+    Returns:
+        Availability data in the same shape as fetch_availability_data
+    """
+    day_availability = DayAvailability(event_index, dates)
+    previous_courts = previous.get("courts", {})
+    with metrics.timer("availability_compute_seconds"):
+        courts_data = {}
+        for court in courts:
+            previous_days = previous_courts.get(str(court), {})
+            courts_data[str(court)] = {
+                date.isoformat(): (day_availability.labels(date, court) if (date, court) in keys
+                                   else previous_days[date.isoformat()])
+                for date in dates
+            }
+    metrics.increment("availability_entries_recomputed_total", len(keys))
+
+    result = {
+        "availability": courts_data.get(str(DISPLAY_COURT), {}),
+        "courts": courts_data,
+        "last_updated": datetime.now(timezone).strftime("%Y-%m-%d %H:%M:%S")
+    }
+    result["content_hash"] = availability_hash(result)
+    return result
+
+def save_availability_to_file(unique_dates, event_index, filename="data/availability.json", horizon_days=None):
+    """
+    Save the availability data to a JSON file.
+    The file is left untouched when its content hash matches, so unchanged runs produce no diff.
+    """
+    return write_availability(fetch_availability_data(unique_dates, event_index, horizon_days=horizon_days),
+                              filename)
+
+def write_availability(data, filename="data/availability.json"):
+    """
+    Write availability data built by fetch_availability_data, unless the file already holds the same content.
+
+    Returns:
+        The data now on disk, or None if it could not be written
+    """
+    try:
+        previous = load_availability(filename)
+        if previous is not None and previous.get("content_hash") == data["content_hash"]:
+            print(f"Availability unchanged ({data['content_hash'][:12]}) - keeping {filename}")
+            return previous
+        with open(filename, 'w') as f:
+            json.dump(data, f)
+        print(f"Availability data saved to {filename}")
+        return data
+    except Exception as e:
+        print(f"Error saving availability data: {e}")
+        return None
+
+def load_availability(filename="data/availability.json"):
+    """Load previously saved availability data, or None if there is none."""
+    try:
+        with open(filename, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,49 @@
+"""
+Benchmark availability computation for the whole facility over a synthetic year.
+
+Times a full build of every day and court (the first run, or one whose
+previous data no longer matches the event store) and the incremental patch
+later runs make when one day's events changed.
+
+Usage:
+    python -m benchmarks.bench_availability [--events 40000] [--repeat 3]
+"""
+import argparse
+import time
+
+from availability import build_event_index, fetch_availability_data, get_court_numbers, patch_availability_data
+from event_parser import parse_schedule_data
+from benchmarks.bench_event_parser import synthetic_year
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=40000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    parsed_events = parse_schedule_data(synthetic_year(args.events))
+    dates = sorted({event["date"] for event in parsed_events})
+
+    best_index = best_full = best_patch = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        event_index = build_event_index(parsed_events)
+        best_index = min(best_index, time.perf_counter() - start)
+
+        courts = get_court_numbers(event_index)
+        start = time.perf_counter()
+        previous = fetch_availability_data(dates, event_index, courts)
+        best_full = min(best_full, time.perf_counter() - start)
+
+        stale = {(dates[len(dates) // 2], court) for court in courts}
+        start = time.perf_counter()
+        patch_availability_data(previous, dates, courts, stale, event_index)
+        best_patch = min(best_patch, time.perf_counter() - start)
+
+    print(f"{len(parsed_events)} events, {len(dates)} days, {len(courts)} courts")
+    print(f"build_event_index        {best_index * 1000:8.1f} ms")
+    print(f"fetch_availability_data  {best_full * 1000:8.1f} ms")
+    print(f"patch_availability_data  {best_patch * 1000:8.1f} ms  ({len(stale)} stale entries)")
+
+if __name__ == "__main__":
+    main()
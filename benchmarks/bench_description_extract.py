@@ -0,0 +1,78 @@
+"""
+Benchmark of description extraction over the recorded events fixture.
+
+Each recorded description is rendered into an event page and extracted with
+the BeautifulSoup slow path and the streaming fast path, after verifying that
+both return the same description for every page.
+
+Parse CPU alone misses what streaming costs on the wire, so both fetchers
+are also timed end to end against the fake calendar server serving the same
+pages, reporting how many connections they opened: a fetcher that closes
+each response early instead of reusing its connection shows up as one
+connection per request.
+
+Usage:
+    python -m benchmarks.bench_description_extract [--repeat 5] [--body-kb 40] [--fetch-events 200]
+"""
+import argparse
+import asyncio
+import time
+
+from fetch_data import (create_session_with_retries, extract_description, fetch_descriptions_async,
+                        get_event_description, parse_description_soup)
+from benchmarks.fake_server import FakeCalendarServer, load_recorded_events, render_page
+
+def bench(name, extract, pages, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            extract(page)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<14} {best * 1000:9.2f} ms total  {best / len(pages) * 1e6:9.1f} us/page")
+    return best
+
+def fetch_threads(events, url):
+    session = create_session_with_retries()
+    for event in events:
+        get_event_description(session, dict(event), url=url)
+
+def fetch_async(events, url):
+    asyncio.run(fetch_descriptions_async([dict(event) for event in events], concurrency=1, rate=1e6, url=url,
+                                         http2=False))
+
+def bench_fetch(name, fetch, events, body_kb):
+    with FakeCalendarServer(events, body_kb=body_kb) as server:
+        start = time.perf_counter()
+        fetch(events, server.url)
+        elapsed = time.perf_counter() - start
+    print(f"{name:<14} {elapsed * 1000:9.2f} ms total  {elapsed / len(events) * 1e6:9.1f} us/request  "
+          f"{server.connections} connections for {server.request_count} requests")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--body-kb", type=int, default=40, help="Approximate size of each page body")
+    parser.add_argument("--fetch-events", type=int, default=200,
+                        help="Events fetched one at a time by each fetcher from the fake server (0 skips)")
+    args = parser.parse_args()
+
+    events = load_recorded_events()
+    pages = [render_page(event, args.body_kb) for event in events]
+
+    mismatches = [page for page in pages if extract_description(page) != parse_description_soup(page)]
+    if mismatches:
+        raise SystemExit(f"Fast path disagrees with BeautifulSoup on {len(mismatches)} of {len(pages)} pages")
+    print(f"Fast path matches BeautifulSoup on all {len(pages)} pages")
+
+    slow = bench("beautifulsoup", parse_description_soup, pages, args.repeat)
+    fast = bench("fast path", extract_description, pages, args.repeat)
+    print(f"Speedup: {slow / fast:.1f}x")
+
+    if args.fetch_events:
+        listed = [{key: event[key] for key in ("title", "url", "event_id")} for event in events[:args.fetch_events]]
+        bench_fetch("fetch threads", fetch_threads, listed, args.body_kb)
+        bench_fetch("fetch async", fetch_async, listed, args.body_kb)
+
+if __name__ == "__main__":
+    main()
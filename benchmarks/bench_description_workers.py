@@ -0,0 +1,78 @@
+"""
+Compare static batch partitioning with the shared work queue for the description stage.
+
+A fake calendar server injects extra latency for a contiguous run of events,
+which under static partitioning all land in the same batch.
+
+Usage:
+    python -m benchmarks.bench_description_workers [--workers 4] [--latency 0.02] [--slow-latency 0.5]
+"""
+import argparse
+import concurrent.futures
+import copy
+import time
+
+from fetch_data import create_session_with_retries, get_event_description, process_event_queue
+from benchmarks.fake_server import FakeCalendarServer, load_recorded_events
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+def split_into_batches(items, num_batches):
+    """Split items into num_batches contiguous, near-equal batches."""
+    avg_size, remainder = divmod(len(items), num_batches)
+    result = []
+    start = 0
+    for i in range(num_batches):
+        end = start + avg_size + (1 if i < remainder else 0)
+        result.append(items[start:end])
+        start = end
+    return result
+
+def run_static_batches(events, num_workers, url):
+    """The previous strategy: one contiguous batch per worker, fixed up front."""
+    start = time.perf_counter()
+    finished = []
+
+    def process_batch(batch):
+        session = create_session_with_retries()
+        for event in batch:
+            get_event_description(session, event, url=url)
+            finished.append(time.perf_counter() - start)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+        list(executor.map(process_batch, split_into_batches(events, num_workers)))
+    return finished
+
+def run_work_queue(events, num_workers, url):
+    start = time.perf_counter()
+    finished = []
+    process_event_queue(events, num_workers, url=url, on_result=lambda _: finished.append(time.perf_counter() - start))
+    return finished
+
+def report(name, finished):
+    print(f"{name:<15} makespan {max(finished):7.2f}s  "
+          f"p50 {percentile(finished, 0.50):7.2f}s  p95 {percentile(finished, 0.95):7.2f}s  "
+          f"p99 {percentile(finished, 0.99):7.2f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--events", type=int, default=200, help="Number of recorded events to replay")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds added to every request")
+    parser.add_argument("--slow-fraction", type=float, default=0.1, help="Fraction of events that are slow")
+    parser.add_argument("--slow-latency", type=float, default=0.5, help="Seconds added to slow requests")
+    args = parser.parse_args()
+
+    events = load_recorded_events()[:args.events]
+    slow_ids = {event["event_id"] for event in events[:int(len(events) * args.slow_fraction)]}
+
+    with FakeCalendarServer(events, latency=args.latency, slow_ids=slow_ids, slow_latency=args.slow_latency) as server:
+        print(f"{len(events)} events, {len(slow_ids)} slow, {args.workers} workers "
+              f"(completion time of each event since start)")
+        report("static batches", run_static_batches(copy.deepcopy(events), args.workers, server.url))
+        report("work queue", run_work_queue(copy.deepcopy(events), args.workers, server.url))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark event_parser over a synthetic year of 25Live descriptions.
+
+Recorded descriptions are re-dated across a whole year, so the time strings
+and locations match what the calendar really produces.
+
+Usage:
+    python -m benchmarks.bench_event_parser [--events 40000] [--repeat 3]
+"""
+import argparse
+import itertools
+import random
+import time
+from datetime import date, timedelta
+
+from event_parser import DESCRIPTION_PATTERN, parse_schedule_data, parse_time
+from benchmarks.fake_server import load_recorded_events
+
+def synthetic_year(count, seed=0):
+    """Build count descriptions spread over a year from the recorded ones."""
+    templates = []
+    for event in load_recorded_events():
+        match = DESCRIPTION_PATTERN.match(event["description"])
+        if match and not match.group("range_start"):
+            # Keep everything after the date, e.g. ", 6 - 8am Woodruff PE Center Court #3"
+            templates.append(event["description"][match.end("year"):])
+
+    rng = random.Random(seed)
+    start = date(2025, 8, 1)
+    descriptions = []
+    for template in itertools.islice(itertools.cycle(templates), count):
+        day = start + timedelta(days=rng.randrange(365))
+        descriptions.append(f"{day:%A}, {day:%B} {day.day}, {day.year}{template}")
+    return descriptions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=40000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    descriptions = synthetic_year(args.events)
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        parse_time.cache_clear()
+        start = time.perf_counter()
+        parsed = parse_schedule_data(descriptions)
+        best = min(best, time.perf_counter() - start)
+
+    print(f"Parsed {len(descriptions)} descriptions into {len(parsed)} events in {best * 1000:.1f} ms "
+          f"({best / len(descriptions) * 1e6:.2f} us/description)")
+    print(f"Time string cache: {parse_time.cache_info()}")
+
+if __name__ == "__main__":
+    main()
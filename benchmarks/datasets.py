@@ -0,0 +1,43 @@
+"""
+Scalable benchmark datasets built from the recorded events fixture.
+
+Scale 1 is the recorded calendar as captured. Scale N appends N - 1 copies
+of it, each moved one year further out with fresh event ids, so every copy
+lands on its own dates and parses, indexes and fetches like real new events
+rather than hitting the same keys again.
+"""
+import re
+
+from benchmarks.fake_server import RECORDED_EVENTS_FILE, load_recorded_events
+
+YEAR_PATTERN = re.compile(r'\b(20\d\d)\b')
+
+def shift_years(description, years):
+    """Move every year in a description forward; the parser ignores the weekday names."""
+    return YEAR_PATTERN.sub(lambda match: str(int(match.group(1)) + years), description)
+
+def scaled_events(scale, recorded_file=RECORDED_EVENTS_FILE):
+    """
+    Build a list of event dictionaries scale times the size of the recorded calendar.
+
+    Args:
+        scale (int): Number of copies of the recorded events
+        recorded_file (str): Recorded events, one JSON object per line
+
+    Returns:
+        list: Event dictionaries with title, url, event_id and description
+    """
+    recorded = load_recorded_events(recorded_file)
+    events = []
+    for copy_number in range(scale):
+        for event in recorded:
+            event = dict(event)
+            if copy_number:
+                event["event_id"] = f"{event['event_id']}-{copy_number}"
+                event["description"] = shift_years(event["description"], copy_number)
+            events.append(event)
+    return events
+
+def scaled_descriptions(scale, recorded_file=RECORDED_EVENTS_FILE):
+    """Descriptions of scaled_events, in order."""
+    return [event["description"] for event in scaled_events(scale, recorded_file)]
@@ -0,0 +1,154 @@
+"""
+Local stand-in for the 25livepub calendar used by the benchmarks and tests.
+
+Serves event pages carrying the recorded descriptions (RECORDED_EVENTS_FILE),
+with configurable injected latency and error rates. It can also be
+scripted to answer the first requests for an event with given statuses and
+headers, and records when each request arrived.
+"""
+import html
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# Frozen copy of a complete checkpoint journal (450 events); the live journal in
+# checkpoints/ is crawler state that every run rewrites
+RECORDED_EVENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "recorded_events.jsonl")
+
+EVENT_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<meta property="description" content="{description}">
+</head>
+<body>
+<div class="twEventDetails">{title}</div>
+</body>
+</html>
+"""
+
+# Stand-in for the calendar chrome that follows the <head> of a real event page
+BODY_ROW = '<tr class="twRow"><td class="twCell"><a href="#" title="Calendar">Calendar</a></td></tr>\n'
+
+def render_page(event, body_kb=0):
+    """Event page for a recorded event, its body padded with calendar rows to roughly body_kb KB."""
+    page = EVENT_PAGE.format(title=html.escape(event.get("title", "")),
+                             description=html.escape(event.get("description", "")))
+    if body_kb:
+        padding = BODY_ROW * (body_kb * 1024 // len(BODY_ROW))
+        page = page.replace("</body>", f"<table>{padding}</table></body>")
+    return page.encode("utf-8")
+
+def load_recorded_events(filename=RECORDED_EVENTS_FILE):
+    """Load the recorded events, one JSON object per line as in a checkpoint journal."""
+    with open(filename, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+class BacklogHTTPServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 resets connections when a client opens dozens at once
+    request_queue_size = 128
+
+class FakeCalendarServer:
+    """
+    Threaded HTTP server replaying recorded event pages.
+
+    Args:
+        events (list): Recorded event dictionaries with event_id, title and description
+        latency (float): Seconds every request is delayed
+        slow_ids (set): Event ids delayed by slow_latency instead of latency
+        slow_latency (float): Seconds a slow request is delayed
+        error_rate (float): Fraction of requests answered with a 503
+        seed (int): Seed for the error injection
+        script (dict): event_id -> list of (status, headers) answered, in order, before the page is served
+        body_kb (int): Approximate size of each page body, as on the real calendar (about 40)
+    """
+
+    def __init__(self, events, latency=0.0, slow_ids=None, slow_latency=1.0, error_rate=0.0, seed=0, script=None,
+                 body_kb=0):
+        self.pages = {event["event_id"]: render_page(event, body_kb) for event in events}
+        self.latency = latency
+        self.slow_ids = set(slow_ids or ())
+        self.slow_latency = slow_latency
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.script = {event_id: list(responses) for event_id, responses in (script or {}).items()}
+        self.lock = threading.Lock()
+        self.request_count = 0
+        # TCP connections accepted, to tell whether clients reuse them
+        self.connections = 0
+        # event_id -> time.monotonic() of each request, in arrival order
+        self.requests = {}
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; with Nagle's algorithm a kept-alive
+            # connection would wait out the client's delayed ACK (about 40 ms) on every response
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                server.handle(self)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                self.rfile.read(length)
+                server.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = BacklogHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}/calendars/25live-woodpec-cal"
+
+    def handle(self, request):
+        event_id = parse_qs(urlparse(request.path).query).get("eventid", [""])[0]
+        with self.lock:
+            self.request_count += 1
+            self.requests.setdefault(event_id, []).append(time.monotonic())
+            scripted = self.script.get(event_id)
+            status, headers = scripted.pop(0) if scripted else (None, {})
+            failed = self.random.random() < self.error_rate
+
+        time.sleep(self.slow_latency if event_id in self.slow_ids else self.latency)
+
+        if status is not None:
+            body = b"Scripted response"
+        elif failed:
+            status, body = 503, b"Service Unavailable"
+        elif event_id in self.pages:
+            status, body = 200, self.pages[event_id]
+        else:
+            status, body = 404, b"Not Found"
+
+        request.send_response(status)
+        request.send_header("Content-Type", "text/html; charset=utf-8")
+        request.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(body)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
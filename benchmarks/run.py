@@ -0,0 +1,170 @@
+"""
+Benchmark harness: every pipeline stage at 1x, 10x and 100x the recorded calendar.
+
+Suites:
+    parse         event_parser.parse_schedule_data
+    availability  build_event_index, get_available_times for one court, fetch_availability_data
+    render        court_availability.generate_html, in a scratch directory
+    fetch         both description fetchers against the local fake calendar server
+
+Each case reports the best of --repeat runs. Results can be appended to a
+JSON-lines file to compare scaling curves between commits.
+
+Usage:
+    python -m benchmarks.run [--suites parse availability render fetch] [--scales 1 10 100]
+                             [--fetch-scales 1 10] [--latency 0.01] [--error-rate 0.0] [--output results.jsonl]
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+
+from availability import DISPLAY_COURT, build_event_index, fetch_availability_data, get_available_times
+from event_parser import parse_schedule_data, parse_time
+from benchmarks.datasets import scaled_descriptions, scaled_events
+from benchmarks.fake_server import FakeCalendarServer
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SUITES = ("parse", "availability", "render", "fetch")
+
+def best_of(repeat, func, setup=None):
+    """Run func repeat times and return (best seconds, last result). setup runs untimed before each run."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def bench_parse(scale, args):
+    descriptions = scaled_descriptions(scale)
+    seconds, _ = best_of(args.repeat, lambda: parse_schedule_data(descriptions), setup=parse_time.cache_clear)
+    yield "parse_schedule_data", len(descriptions), seconds
+
+def bench_availability(scale, args):
+    parsed_events = parse_schedule_data(scaled_descriptions(scale))
+    dates = sorted({event["date"] for event in parsed_events})
+
+    seconds, event_index = best_of(args.repeat, lambda: build_event_index(parsed_events))
+    yield "build_event_index", len(parsed_events), seconds
+
+    seconds, _ = best_of(args.repeat, lambda: [get_available_times(day, event_index, DISPLAY_COURT) for day in dates])
+    yield "get_available_times", len(dates), seconds
+
+    seconds, _ = best_of(args.repeat, lambda: fetch_availability_data(dates, event_index))
+    yield "fetch_availability_data", len(dates), seconds
+
+@contextmanager
+def scratch_site():
+    """Work in a temporary copy of the site so generate_html leaves the checkout alone."""
+    previous_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as site_dir:
+        shutil.copytree(os.path.join(REPO_DIR, "static"), os.path.join(site_dir, "static"))
+        os.makedirs(os.path.join(site_dir, "data"))
+        os.chdir(site_dir)
+        try:
+            yield site_dir
+        finally:
+            os.chdir(previous_dir)
+
+def bench_render(scale, args):
+    from court_availability import HTML_FILE, generate_html
+
+    parsed_events = parse_schedule_data(scaled_descriptions(scale))
+    dates = sorted({event["date"] for event in parsed_events})
+    data = fetch_availability_data(dates, build_event_index(parsed_events))
+
+    def force_render():
+        # generate_html skips pages that are already up to date
+        if os.path.exists(HTML_FILE):
+            os.remove(HTML_FILE)
+
+    with scratch_site():
+        seconds, rendered = best_of(args.repeat, lambda: generate_html(data), setup=force_render)
+        if not rendered:
+            raise SystemExit("generate_html did not render")
+        yield "generate_html", len(dates), seconds
+
+        # The unchanged case every 5-minute run after the first one hits
+        seconds, _ = best_of(args.repeat, lambda: generate_html(data))
+        yield "generate_html_unchanged", len(dates), seconds
+
+def count_fetched(results):
+    from fetch_data import is_fetched_description
+    return sum(1 for event in results if is_fetched_description(event.get("description")))
+
+def bench_fetch(scale, args):
+    from fetch_data import fetch_descriptions_async, process_event_queue
+
+    events = scaled_events(scale)
+    with FakeCalendarServer(events, latency=args.latency, error_rate=args.error_rate) as server:
+        seconds, results = best_of(args.repeat, lambda: asyncio.run(fetch_descriptions_async(
+            copy.deepcopy(events), concurrency=args.concurrency, rate=args.rate, url=server.url, http2=False)))
+        print(f"  async: {count_fetched(results)} of {len(events)} descriptions fetched")
+        yield f"fetch_async_c{args.concurrency}", len(events), seconds
+
+        seconds, results = best_of(args.repeat, lambda: process_event_queue(
+            copy.deepcopy(events), args.workers, url=server.url))
+        print(f"  threads: {count_fetched(results)} of {len(events)} descriptions fetched")
+        yield f"fetch_threads_w{args.workers}", len(events), seconds
+
+BENCHMARKS = {
+    "parse": bench_parse,
+    "availability": bench_availability,
+    "render": bench_render,
+    "fetch": bench_fetch,
+}
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=REPO_DIR).stdout.strip() or None
+    except OSError:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--suites", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--scales", nargs="+", type=int, default=[1, 10, 100],
+                        help="Dataset sizes as multiples of the recorded calendar")
+    parser.add_argument("--fetch-scales", nargs="+", type=int, default=[1, 10],
+                        help="Dataset sizes for the fetch suite, which makes one request per event")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds the fake server delays every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests the fake server fails with 503")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=1000.0, help="Request rate limit for the async fetcher")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--output", metavar="PATH", help="Append results to this JSON-lines file")
+    args = parser.parse_args()
+
+    revision = git_revision()
+    results = []
+    print(f"{'case':<26} {'scale':>6} {'items':>8} {'best':>11} {'per item':>12}")
+    for suite in args.suites:
+        scales = args.fetch_scales if suite == "fetch" else args.scales
+        for scale in scales:
+            for case, items, seconds in BENCHMARKS[suite](scale, args):
+                print(f"{case:<26} {scale:>5}x {items:>8} {seconds * 1000:>8.1f} ms "
+                      f"{seconds / max(items, 1) * 1e6:>9.1f} us")
+                results.append({"suite": suite, "case": case, "scale": scale, "items": items,
+                                "seconds": round(seconds, 6), "revision": revision})
+
+    if args.output:
+        with open(args.output, 'a', encoding='utf-8') as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+        print(f"Appended {len(results)} results to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Run-to-run change detection for the calendar.
+
+Each run's described events are synced into the event store (see
+event_store.py), which compares each description's hash with the one its
+stored spans were parsed from. The result is a changeset of added, removed and changed events plus
+the (date, court) availability entries they touch. Unchanged events are
+never re-parsed, and only the touched entries of the previous availability
+data are recomputed.
+"""
+import hashlib
+
+from event_parser import parse_description
+from availability import event_spans
+
+def description_hash(description):
+    return hashlib.sha256((description or "").encode("utf-8")).hexdigest()[:16]
+
+def event_entry(event):
+    """
+    Parse one described event for the store.
+
+    Returns:
+        Dictionary with title, description_hash, dates (sorted ISO strings) and
+        spans ([ISO date, court, start_minute, end_minute] lists)
+    """
+    parsed_events = parse_description(event.get("description") or "")
+    return {
+        "title": event.get("title"),
+        "description_hash": description_hash(event.get("description")),
+        "dates": sorted({parsed["date"].isoformat() for parsed in parsed_events}),
+        "spans": [[day.isoformat(), court, start, end] for day, court, start, end in event_spans(parsed_events)]
+    }
+
+def summarize(changeset):
+    return (f"{len(changeset['added'])} added, {len(changeset['removed'])} removed, "
+            f"{len(changeset['changed'])} changed events affecting {len(changeset['affected'])} (date, court) entries")
@@ -1,32 +1,96 @@
 import os
+import re
 import json
+import glob
+import hashlib
 import time
 from datetime import datetime, timedelta
 import requests
 from flask import Flask, render_template_string
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
 # from fetch_data import save_availability_to_file
 import subprocess
 import pytz
+import metrics
 
 # Configuration
 REPO_NAME = "court-availability"
 DATA_FILE = "data/availability.json"
 HTML_FILE = "index.html"
+CURRENT_DATA_FILE = "data/current.json"
+CSS_FILE = "static/style.css"
+JS_FILE = "static/refresh.js"
+# Days shown on the page, starting today
+DISPLAY_DAYS = 7
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+# Compiled template bytecode; CI carries it between runs with actions/cache, like the crawler state
+TEMPLATE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "jinja")
 timezone = pytz.timezone('US/Eastern')
 
-def generate_html():
-    """Generate the HTML page using the saved data."""
+# Templates are compiled once per process and their bytecode is cached in TEMPLATE_CACHE_DIR between runs
+os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+template_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    bytecode_cache=FileSystemBytecodeCache(TEMPLATE_CACHE_DIR),
+    autoescape=select_autoescape(["html"])
+)
+
+def file_version(filename):
+    """Short content hash used to bust browser caches when a static file changes."""
+    with open(filename, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+# Marker in the generated page recording which data and day it was rendered from
+RENDER_VERSION_PATTERN = re.compile(r'<meta name="availability-version" content="([^"]*)">')
+
+def rendered_version():
+    """Return the render version recorded in the current HTML page, or None."""
+    try:
+        with open(HTML_FILE, 'r') as f:
+            match = RENDER_VERSION_PATTERN.search(f.read())
+    except OSError:
+        return None
+    return match.group(1) if match else None
+
+def generate_html(data=None, days=DISPLAY_DAYS):
+    """
+    Generate the HTML page using the saved data.
+    Rendering is skipped when the page already shows the same data for the same day.
+
+    Args:
+        data: Availability data from availability.fetch_availability_data; read from DATA_FILE if omitted
+        days: Number of days to show, starting today
+
+    Returns:
+        bool: True if index.html was (re)written
+    """
     try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
+        raw_data = None
+        if data is None:
+            with open(DATA_FILE, 'rb') as f:
+                raw_data = f.read()
+            data = json.loads(raw_data)
         
         availability = data["availability"]
         last_updated = data["last_updated"]
         
-        all_date_strs = data["availability"].keys() # this format: 2025-03-22
         today = datetime.now(timezone)
+        content_hash = data.get("content_hash")
+        if not content_hash:
+            # Data from before content hashes were recorded
+            if raw_data is None:
+                raw_data = json.dumps(data, sort_keys=True).encode()
+            content_hash = hashlib.sha256(raw_data).hexdigest()
+        css_version = file_version(CSS_FILE)
+        js_version = file_version(JS_FILE)
+        render_version = f"{content_hash}:{today.strftime('%Y-%m-%d')}+{days}:{css_version}:{js_version}"
+        if render_version == rendered_version():
+            print(f"HTML already up to date for {render_version} - skipping render")
+            return False
+        
+        all_date_strs = data["availability"].keys() # this format: 2025-03-22
         dates_str = []
-        for i in range(7):
+        for i in range(days):
             date = today + timedelta(days=i)
             date_str = date.strftime("%Y-%m-%d")
             dates_str.append(date_str)
@@ -51,130 +115,75 @@ def generate_html():
                     "slots": availability.get(date_str, []),
                     "no_data": False
                 })
-        
-        # HTML template
-        html_template = """
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <meta http-equiv="refresh" content="900"> <!-- Refresh every 15 minutes -->
-            <title>Woodpec PE Court #3 Availability</title>
-            <style>
-                body {
-                    font-family: Arial, sans-serif;
-                    max-width: 1000px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    line-height: 1.6;
-                }
-                h1 {
-                    text-align: center;
-                    color: #2c3e50;
-                }
-                h3 {
-                    text-align: center;
-                    color: #2c3e50;
-                }
-                .updated {
-                    text-align: center;
-                    font-style: italic;
-                    color: #7f8c8d;
-                    margin-bottom: 20px;
-                }
-                .day-container {
-                    margin-bottom: 30px;
-                    border: 1px solid #ddd;
-                    border-radius: 5px;
-                    padding: 15px;
-                }
-                h2 {
-                    margin-top: 0;
-                    color: #3498db;
-                    border-bottom: 1px solid #eee;
-                    padding-bottom: 10px;
-                }
-                .slots {
-                    display: flex;
-                    flex-wrap: wrap;
-                    gap: 10px;
-                }
-                .slot {
-                    background-color: #2ecc71;
-                    color: white;
-                    padding: 8px 12px;
-                    border-radius: 4px;
-                    display: inline-block;
-                }
-                .no-slots {
-                    color: #e74c3c;
-                    font-style: italic;
-                }
-                .no-data {
-                    color: #f39c12;
-                    font-style: italic;
-                }
-                @media (max-width: 600px) {
-                    body {
-                        padding: 10px;
-                    }
-                    .day-container {
-                        padding: 10px;
-                    }
-                }
-            </style>
-        </head>
-        <body>
-            <h1>Woodruff PE Center Court #3 Availability</h1>
-            <h3> Badminton Courts at WoodPEC, Emory University <h3>
-            <p class="updated">Last updated: {{ last_updated }}</p>
-            
-            {% for day in dates %}
-            <div class="day-container">
-                <h2>{{ day.display }}</h2>
-                <div class="slots">
-                    {% if day.no_data %}
-                        <p class="no-data">No data available</p>
-                    {% elif day.slots %}
-                        {% for slot in day.slots %}
-                            <div class="slot">{{ slot }}</div>
-                        {% endfor %}
-                    {% else %}
-                        <p class="no-slots">No available slots</p>
-                    {% endif %}
-                </div>
-            </div>
-            {% endfor %}
-            <footer class="byline">Coded by Claude 3.7 & GPT4, prompted & put them together by <a href="https://toan-vt.github.io" target="_blank">Toan Tran</a> | I am not responsible for any errors in court availability information :) | Created in a random boring evening :) on March 3, 2025 </footer>
-        </body>
-        </html>
-        """
+
+        # Lets the refresh script tell which day blocks changed
+        for day in dates:
+            day["signature"] = hashlib.sha256(json.dumps([day["display"], day["slots"], day["no_data"]]).encode()).hexdigest()[:12]
         
         # Render the template with the data
-        from jinja2 import Template
-        template = Template(html_template)
-        rendered_html = template.render(dates=dates, last_updated=last_updated)
+        with metrics.timer("render_seconds"):
+            template = template_env.get_template("index.html")
+            rendered_html = template.render(dates=dates, last_updated=last_updated, render_version=render_version,
+                                            css_version=css_version, js_version=js_version)
         
         # Write the HTML to file
         with open(HTML_FILE, 'w') as f:
             f.write(rendered_html)
+
+        publish_current_data(render_version, last_updated, dates)
             
         print(f"HTML generated at {datetime.now(timezone).strftime('%Y-%m-%d %H:%M:%S')}")
+        return True
         
     except Exception as e:
         print(f"Error generating HTML: {e}")
+        return False
+
+def publish_current_data(render_version, last_updated, dates):
+    """
+    Publish the displayed days for the page's refresh script.
+
+    The days go to an immutable file named after its content hash, and
+    CURRENT_DATA_FILE is a small pointer to it. Clients poll the pointer with
+    conditional requests and only download the days file when it changes.
+    """
+    payload = json.dumps({"version": render_version, "last_updated": last_updated, "dates": dates},
+                         separators=(",", ":"))
+    data_file = f"data/current-{hashlib.sha256(payload.encode()).hexdigest()[:12]}.json"
+    with open(data_file, 'w') as f:
+        f.write(payload)
+
+    with open(CURRENT_DATA_FILE, 'w') as f:
+        json.dump({"version": render_version, "last_updated": last_updated, "data": data_file}, f,
+                  separators=(",", ":"))
+
+    # Keep only the days file the pointer refers to
+    for stale_file in glob.glob("data/current-*.json"):
+        if stale_file != data_file:
+            os.remove(stale_file)
 
 def update_data():
     """Fetch new data and update the website."""
     # save_availability_to_file()
-    generate_html()
-    commit_and_push_changes()
+    if generate_html():
+        commit_and_push_changes()
+
+def commit_and_push_changes(summary=None):
+    """
+    Commit and push changes to GitHub, skipping the commit when nothing changed.
 
-def commit_and_push_changes():
-    """Commit and push changes to GitHub."""
-    subprocess.run(["git", "add", HTML_FILE, DATA_FILE])
-    subprocess.run(["git", "commit", "-m", f"Update court availability {datetime.now(timezone).strftime('%Y-%m-%d %H:%M:%S')}"])
+    Args:
+        summary: Optional description of what changed, added to the commit message
+    """
+    # The description cache under data/ is gitignored, so only the published availability and page are staged
+    subprocess.run(["git", "add", "-A", HTML_FILE, "data", "static"])
+    if subprocess.run(["git", "diff", "--cached", "--quiet"]).returncode == 0:
+        print("No changes to commit")
+        return
+    message = f"Update court availability {datetime.now(timezone).strftime('%Y-%m-%d %H:%M:%S')}"
+    if summary:
+        message = f"{message}\n\n{summary}"
+    subprocess.run(["git", "commit", "-m", message])
     subprocess.run(["git", "push", "origin", "main"])
 
 if __name__ == "__main__":
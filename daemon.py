@@ -0,0 +1,152 @@
+"""
+Resident scheduler replacing the cold-start fetch -> process -> render cron chain.
+
+Keeps the HTTP session, any headless browsers, the description cache, the
+latest event listing and parsed availability warm between ticks, and runs each stage on its own interval:
+
+    crawl     re-read the calendar month view (default hourly)
+    describe  refresh new/stale descriptions and recompute availability (default every 5 minutes)
+    render    regenerate index.html when the data or the day changed (default every minute)
+
+Intervals get random jitter, and a tick that starts while another stage is
+still running is skipped rather than queued behind it.
+
+Usage:
+    python daemon.py [--crawl-interval 3600] [--describe-interval 300] [--render-interval 60] [--publish]
+
+Takes the same listing, fetching and output options as pipeline.py.
+"""
+import os
+import time
+import argparse
+import threading
+import schedule
+import metrics
+from fetch_data import (CALENDAR_URL, JOURNAL_FILE, BrowserPool, Deadline, add_budget_arg, add_fetch_args,
+                        add_metrics_args, create_session_with_retries, evict_stale_descriptions, extract_events,
+                        load_description_cache)
+from event_parser import iter_journal
+from changeset import summarize
+from pipeline import add_output_args, describe_events, update_availability
+from court_availability import DATA_FILE, commit_and_push_changes, generate_html
+
+class PipelineDaemon:
+    """Pipeline stages sharing warm state between scheduler ticks."""
+
+    def __init__(self, args):
+        self.args = args
+        self.session = create_session_with_retries()
+        # Only started if the HTTP extractor falls back to Selenium, then reused by later crawls
+        self.browser_pool = BrowserPool(args.browsers)
+        self.cache = load_description_cache(ttl=args.description_ttl)
+        self.event_links = []
+        self.journal_file = os.path.join(args.checkpoint_dir, JOURNAL_FILE)
+        self.journal_mtime = None
+        self.changes = None
+        # One stage at a time: they share the listing, cache and journal
+        self.lock = threading.Lock()
+
+    def crawl(self):
+        event_links = extract_events(CALENDAR_URL, self.args.extractor, self.args.listing_html, self.session,
+                                     months=self.args.months, pool=self.browser_pool)
+        if not event_links:
+            print("No event links were extracted - keeping the previous listing")
+            return
+        self.event_links = event_links
+
+    def describe(self):
+        if not self.event_links:
+            self.crawl()
+        if not self.event_links:
+            return
+
+        evicted = evict_stale_descriptions(self.cache, self.args.description_ttl)
+        if evicted:
+            print(f"Evicted {evicted} stale cached descriptions")
+
+        deadline = Deadline(self.args.budget) if self.args.budget is not None else None
+        describe_events(self.event_links, self.args, self.cache, deadline)
+        self.process()
+
+    def process(self):
+        """Patch availability from the journal's changes, but only when the journal changed since the last tick."""
+        try:
+            mtime = os.path.getmtime(self.journal_file)
+        except OSError:
+            print(f"No journal at {self.journal_file} yet")
+            return
+        if mtime == self.journal_mtime:
+            return
+
+        _, changeset = update_availability(iter_journal(self.journal_file), DATA_FILE, self.args.store_file,
+                                           self.args.horizon_days)
+        self.changes = summarize(changeset)
+        self.journal_mtime = mtime
+        self.render()
+
+    def render(self):
+        if generate_html(days=self.args.display_days) and self.args.publish:
+            commit_and_push_changes(self.changes)
+            self.changes = None
+
+    def run_stage(self, name, stage):
+        """Run a stage in the background unless another one is still in progress."""
+        if not self.lock.acquire(blocking=False):
+            print(f"[{name}] skipped - previous tick still running")
+            return
+
+        def target():
+            start = time.perf_counter()
+            try:
+                with metrics.timer("stage_seconds", stage=name):
+                    stage()
+                print(f"[{name}] completed in {time.perf_counter() - start:.2f} seconds")
+            except Exception as e:
+                metrics.increment("stage_failures_total", stage=name)
+                print(f"[{name}] failed: {e}")
+            finally:
+                # One summary per tick, so the JSON-lines file doubles as a time series
+                metrics.write(self.args.metrics_file, self.args.prometheus_file, run=name)
+                metrics.reset()
+                self.lock.release()
+
+        threading.Thread(target=target, name=name, daemon=True).start()
+
+    def schedule_stage(self, name, stage, interval):
+        # Random interval in [interval, interval * (1 + jitter)] so ticks don't line up with other clients
+        latest = max(int(interval), int(interval * (1 + self.args.jitter)))
+        schedule.every(int(interval)).to(latest).seconds.do(self.run_stage, name, stage)
+
+    def run(self):
+        self.schedule_stage("crawl", self.crawl, self.args.crawl_interval)
+        self.schedule_stage("describe", self.describe, self.args.describe_interval)
+        self.schedule_stage("render", self.render, self.args.render_interval)
+
+        # Warm everything up once before settling into the schedule
+        self.run_stage("startup", lambda: (self.crawl(), self.describe()))
+        try:
+            while True:
+                schedule.run_pending()
+                time.sleep(1)
+        finally:
+            self.browser_pool.close()
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the availability pipeline as a resident daemon.")
+    parser.add_argument("--crawl-interval", type=float, default=60 * 60, metavar="SECONDS",
+                        help="Seconds between full calendar crawls")
+    parser.add_argument("--describe-interval", type=float, default=5 * 60, metavar="SECONDS",
+                        help="Seconds between description refreshes")
+    parser.add_argument("--render-interval", type=float, default=60, metavar="SECONDS",
+                        help="Seconds between checks whether index.html needs re-rendering")
+    parser.add_argument("--jitter", type=float, default=0.1,
+                        help="Fraction by which each interval may be randomly stretched")
+    add_fetch_args(parser)
+    add_output_args(parser)
+    # Each describe tick counts as a run
+    add_budget_arg(parser)
+    add_metrics_args(parser)
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    PipelineDaemon(parse_args()).run()
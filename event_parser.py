@@ -0,0 +1,168 @@
+"""
+Single-pass parser for 25Live event descriptions.
+
+A description looks like one of:
+
+    Monday, December 1, 2025, 6 - 8am Woodruff PE Center Court #3
+    Monday, December 1, 2025 Woodruff PE Center Court #3
+    Friday, December 5, 7pm - Sunday, December 7, 2025, 1pm Woodruff PE Center Pool
+
+and is turned into one event per day with typed date, start and end values.
+"""
+import re
+import json
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+MONTHS = {
+    name: number for number, name in enumerate(
+        ["January", "February", "March", "April", "May", "June", "July",
+         "August", "September", "October", "November", "December"], start=1)
+}
+
+TIME = r'\d+(?::\d+)?(?:am|pm)?'
+
+DESCRIPTION_PATTERN = re.compile(
+    r'[A-Za-z]+, (?P<month>[A-Za-z]+) (?P<day>\d+)'
+    r'(?:'
+    # Multi-day range: the start day carries no year, the end day does
+    rf', (?P<range_start>{TIME}) - [A-Za-z]+, (?P<end_month>[A-Za-z]+) (?P<end_day>\d+), (?P<end_year>\d{{4}}), (?P<range_end>{TIME})'
+    r'|'
+    # Single day, optionally with a time range
+    rf', (?P<year>\d{{4}})(?:,?\s*(?P<start>{TIME}) - (?P<end>{TIME}))?'
+    r')'
+    r'(?P<location>.+)'
+)
+
+TIME_PATTERN = re.compile(r'(\d+)(?::(\d+))?(am|pm)?')
+
+DAY_START = time(0, 0)
+DAY_END = time(23, 59)
+
+@lru_cache(maxsize=None)
+def parse_time(time_str, context_time_str=None):
+    """
+    Parse time strings with flexible formats (e.g., '7pm', '10:30am', '14:30', '7')
+    If a time is provided without am/pm, infer it from context_time_str if available.
+    Results are memoized, since descriptions reuse a small set of time strings.
+
+    Returns:
+        datetime.time
+    """
+    time_str = time_str.lower().strip()
+
+    match = TIME_PATTERN.fullmatch(time_str)
+    if not match:
+        raise ValueError(f"Time format not recognized: {time_str}")
+    hour, minute, meridiem = int(match.group(1)), int(match.group(2) or 0), match.group(3)
+
+    if meridiem is None and context_time_str:
+        # Infer am/pm from context_time_str, as in "4:30 - 6:30pm"
+        context = context_time_str.lower()
+        if 'pm' in context:
+            meridiem = 'pm'
+        elif 'am' in context:
+            meridiem = 'am'
+
+    if meridiem:
+        if not 1 <= hour <= 12:
+            raise ValueError(f"Time format not recognized: {time_str}")
+        hour = hour % 12 + (12 if meridiem == 'pm' else 0)
+    elif match.group(2) is None:
+        # A bare hour is ambiguous without am/pm
+        raise ValueError(f"Time format not recognized: {time_str}")
+
+    if hour > 23 or minute > 59:
+        raise ValueError(f"Time format not recognized: {time_str}")
+    return time(hour, minute)
+
+def _event(day, start, end, location):
+    return {
+        "date": day,
+        "start": datetime.combine(day, start),
+        "end": datetime.combine(day, end),
+        "location": location
+    }
+
+def parse_description(description: str) -> List[Dict]:
+    """
+    Parse one event description into a list of per-day events.
+
+    Args:
+        description: 25Live event description
+
+    Returns:
+        A list of dictionaries with date (date), start and end (datetime)
+        and location (str), one per day the event covers. Empty if the
+        description could not be parsed.
+    """
+    match = DESCRIPTION_PATTERN.match(description)
+    if not match:
+        return []
+
+    groups = match.groupdict()
+    location = groups["location"].strip()
+    try:
+        month = MONTHS[groups["month"]]
+        if groups["range_start"]:
+            end_day = date(int(groups["end_year"]), MONTHS[groups["end_month"]], int(groups["end_day"]))
+            # A range that starts in a later month than it ends crosses into the next year
+            start_year = end_day.year - 1 if month > end_day.month else end_day.year
+            start_day = date(start_year, month, int(groups["day"]))
+            start_time = parse_time(groups["range_start"], groups["range_end"])
+            end_time = parse_time(groups["range_end"])
+        else:
+            start_day = end_day = date(int(groups["year"]), month, int(groups["day"]))
+            if groups["start"]:
+                start_time = parse_time(groups["start"], groups["end"])
+                end_time = parse_time(groups["end"])
+            else:
+                # If no time is given, it means the entire date
+                start_time, end_time = DAY_START, DAY_END
+    except (KeyError, ValueError):
+        return []
+
+    if start_day == end_day:
+        return [_event(start_day, start_time, end_time, location)]
+
+    # First day uses start_time, last day uses end_time, others use full day
+    events = [_event(start_day, start_time, DAY_END, location)]
+    current_day = start_day + timedelta(days=1)
+    while current_day < end_day:
+        events.append(_event(current_day, DAY_START, DAY_END, location))
+        current_day += timedelta(days=1)
+    events.append(_event(end_day, DAY_START, end_time, location))
+    return events
+
+def parse_schedule_data(events_list: Iterable[str]) -> List[Dict]:
+    """
+    Parse schedule data from event description strings into structured format.
+    Handles both single-day and multi-day formats.
+    """
+    parsed_events = []
+    for event in events_list:
+        if not event.strip():
+            continue
+
+        events = parse_description(event)
+        if events:
+            parsed_events.extend(events)
+        else:
+            print(f"Failed to parse event: {event}")
+
+    return parsed_events
+
+def iter_journal(filename="checkpoints/journal.jsonl"):
+    """
+    Stream events from the checkpoint journal written by fetch_data.py, one JSON object per line.
+
+    Records are yielded as written; fetch_data.read_journal collapses them to the last one per event.
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # A run killed mid-write can leave a torn last line
+                print(f"Skipping unreadable journal line: {line[:80]}")
@@ -0,0 +1,237 @@
+"""
+SQLite event store shared by the describe and availability stages.
+
+One row per listed event with typed columns (event_id, title, url,
+description, first and last date, fetched_at), plus the
+(date, court, start_minute, end_minute) spans and event days its
+description parsed to, indexed by date and court:
+
+    with EventStore() as store:
+        changeset = store.sync(events)
+        index = store.event_index(changeset["affected"])
+        store.commit()
+
+The describe stage upserts each description as it is fetched (upsert());
+spans are only reparsed by sync(), which also drops events no longer listed
+and returns the changeset against the spans stored before (see
+changeset.py). The availability engine and server.py read dates and spans
+back with indexed range queries instead of reloading every event; the
+server opens the store read-only, so it never creates or rebuilds it.
+
+The store is crawler state like the journal and the description cache: it
+is not committed, and CI carries it between runs with actions/cache. A
+missing or outdated store is rebuilt from the journal on the next sync.
+"""
+import os
+import sqlite3
+from datetime import date
+from urllib.parse import quote
+
+import metrics
+from availability import COURT_NUMBERS, index_spans
+from changeset import description_hash, event_entry
+
+STORE_FILE = "checkpoints/events.sqlite"
+
+# Bumped whenever SCHEMA changes; a store with another version is rebuilt from scratch
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    event_id TEXT PRIMARY KEY,
+    title TEXT,
+    url TEXT,
+    description TEXT,
+    description_hash TEXT NOT NULL,
+    start_date TEXT,
+    end_date TEXT,
+    fetched_at REAL,
+    parsed_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS events_by_start_date ON events (start_date);
+
+CREATE TABLE IF NOT EXISTS event_days (
+    event_id TEXT NOT NULL,
+    day TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS event_days_by_day ON event_days (day);
+CREATE INDEX IF NOT EXISTS event_days_by_event ON event_days (event_id);
+
+CREATE TABLE IF NOT EXISTS spans (
+    event_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    court INTEGER NOT NULL,
+    start_minute INTEGER NOT NULL,
+    end_minute INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS spans_by_day_court ON spans (day, court);
+CREATE INDEX IF NOT EXISTS spans_by_event ON spans (event_id);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+class EventStore:
+    """
+    Events and their parsed spans in one SQLite file.
+
+    Writes are not committed until commit(), so a run that fails half way
+    leaves the store as the previous run committed it.
+
+    Args:
+        filename: SQLite file, created if missing unless readonly
+        readonly: Open an existing store for reading only; raises ValueError if it was
+            written with another SCHEMA_VERSION instead of rebuilding it
+    """
+
+    def __init__(self, filename=STORE_FILE, readonly=False):
+        self.filename = filename
+        if readonly:
+            # Shared by the server's request threads, which read under its lock
+            self.connection = sqlite3.connect(f"file:{quote(os.path.abspath(filename))}?mode=ro", uri=True,
+                                              check_same_thread=False)
+            version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self.connection.close()
+                raise ValueError(f"{filename} has schema version {version}, expected {SCHEMA_VERSION}")
+            return
+
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        # Shared with the threads fetcher's workers, which upsert under its results lock
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self.connection.executescript("DROP TABLE IF EXISTS events; DROP TABLE IF EXISTS event_days; "
+                                          "DROP TABLE IF EXISTS spans; DROP TABLE IF EXISTS meta;")
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.connection.executescript(SCHEMA)
+
+    def commit(self):
+        self.connection.commit()
+
+    def close(self):
+        """Close the store, discarding anything not committed."""
+        self.connection.rollback()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get_meta(self, key):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        self.connection.execute("INSERT INTO meta (key, value) VALUES (?, ?) "
+                                "ON CONFLICT (key) DO UPDATE SET value = excluded.value", (key, value))
+
+    def upsert(self, event):
+        """
+        Store an event's latest description without reparsing its spans.
+
+        Args:
+            event: Event dictionary with event_id, title, url and description, and fetched_at
+                (epoch seconds the description was fetched) when known
+        """
+        self.connection.execute(
+            "INSERT INTO events (event_id, title, url, description, description_hash, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (event_id) DO UPDATE SET title = excluded.title, url = excluded.url, "
+            "description = excluded.description, description_hash = excluded.description_hash, "
+            "fetched_at = COALESCE(excluded.fetched_at, events.fetched_at)",
+            (event["event_id"], event.get("title"), event.get("url"), event.get("description"),
+             description_hash(event.get("description")), event.get("fetched_at")))
+
+    def sync(self, events):
+        """
+        Make the store hold exactly the given events and reparse those whose description changed.
+
+        Descriptions already upserted by the describe stage count as changes until synced.
+
+        Args:
+            events: Iterable of described event dictionaries with event_id, title, url and description
+
+        Returns:
+            Changeset dictionary with sorted added, removed and changed event ids and the set of
+            (date, court) keys whose spans they touched, before or after the change
+        """
+        seen = set()
+        for event in events:
+            seen.add(event["event_id"])
+            self.upsert(event)
+
+        stored = [event_id for event_id, in self.connection.execute("SELECT event_id FROM events")]
+        removed = sorted(set(stored) - seen)
+        affected = set()
+        for event_id in removed:
+            affected.update(self._delete(event_id))
+            self.connection.execute("DELETE FROM events WHERE event_id = ?", (event_id,))
+
+        added, changed = [], []
+        query = ("SELECT event_id, description, description_hash, parsed_hash FROM events "
+                 "WHERE parsed_hash IS NULL OR parsed_hash != description_hash")
+        for event_id, description, stored_hash, parsed_hash in self.connection.execute(query).fetchall():
+            if parsed_hash is not None:
+                affected.update(self._delete(event_id))
+            entry = event_entry({"event_id": event_id, "description": description})
+            self._insert_spans(event_id, entry)
+            affected.update((date.fromisoformat(day), court) for day, court, _, _ in entry["spans"])
+            (added if parsed_hash is None else changed).append(event_id)
+
+        return {"added": sorted(added), "removed": removed, "changed": sorted(changed), "affected": affected}
+
+    def _delete(self, event_id):
+        """Drop an event's days and spans, returning the (date, court) keys they covered."""
+        keys = {(date.fromisoformat(day), court) for day, court
+                in self.connection.execute("SELECT day, court FROM spans WHERE event_id = ?", (event_id,))}
+        self.connection.execute("DELETE FROM spans WHERE event_id = ?", (event_id,))
+        self.connection.execute("DELETE FROM event_days WHERE event_id = ?", (event_id,))
+        return keys
+
+    def _insert_spans(self, event_id, entry):
+        dates = entry["dates"]
+        self.connection.execute(
+            "UPDATE events SET start_date = ?, end_date = ?, parsed_hash = ? WHERE event_id = ?",
+            (dates[0] if dates else None, dates[-1] if dates else None, entry["description_hash"], event_id))
+        self.connection.executemany("INSERT INTO event_days (event_id, day) VALUES (?, ?)",
+                                    [(event_id, day) for day in dates])
+        self.connection.executemany(
+            "INSERT INTO spans (event_id, day, court, start_minute, end_minute) VALUES (?, ?, ?, ?, ?)",
+            [(event_id, day, court, start, end) for day, court, start, end in entry["spans"]])
+
+    def dates(self, start=None, end=None):
+        """Sorted dates in [start, end) that any event falls on; unbounded on a side given as None."""
+        query = "SELECT DISTINCT day FROM event_days WHERE day >= ? AND day < ? ORDER BY day"
+        bounds = (start.isoformat() if start else "", end.isoformat() if end else "9999-12-31")
+        return [date.fromisoformat(day) for day, in self.connection.execute(query, bounds)]
+
+    def courts(self):
+        """Every court known to the facility or booked by a stored event."""
+        booked = {court for court, in self.connection.execute("SELECT DISTINCT court FROM spans")}
+        return sorted(booked.union(COURT_NUMBERS))
+
+    def spans(self, start, end, courts=None):
+        """
+        Yield (date, court, start_minute, end_minute) for spans on dates in [start, end].
+
+        Args:
+            start, end: First and last date, inclusive
+            courts: Optional collection of courts to restrict to
+        """
+        query = "SELECT day, court, start_minute, end_minute FROM spans WHERE day BETWEEN ? AND ?"
+        for day, court, start_minute, end_minute in self.connection.execute(query, (start.isoformat(),
+                                                                                    end.isoformat())):
+            if courts is None or court in courts:
+                yield date.fromisoformat(day), court, start_minute, end_minute
+
+    def event_index(self, keys):
+        """Event index (see availability.build_event_index) restricted to the given (date, court) keys."""
+        if not keys:
+            return {}
+        days = [day for day, _ in keys]
+        with metrics.timer("event_index_build_seconds"):
+            return index_spans(span for span in self.spans(min(days), max(days)) if span[:2] in keys)
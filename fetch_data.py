@@ -1,22 +1,115 @@
 import time
+import asyncio
 import concurrent.futures
+import contextlib
+import queue
+import threading
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, StaleElementReferenceException,
+                                        WebDriverException)
 import csv
 import requests
-from bs4 import BeautifulSoup
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
 from tqdm import tqdm
 import os
 import json
+import argparse
+import html
+import re
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode, urljoin, urlparse, parse_qs
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+import metrics
+from event_parser import iter_journal, parse_description
+from availability import DISPLAY_COURT, booked_courts
+from event_store import STORE_FILE, EventStore
 
-def extract_event_urls(url):
-    """Extract all event URLs from the 25Live calendar, handling iframe content."""
+CALENDAR_URL = "https://25livepub.collegenet.com/calendars/25live-woodpec-cal"
+
+# Timeout (seconds) for plain HTTP requests made with the shared session
+REQUEST_TIMEOUT = 15
+
+# Retry policy shared by the requests session and the asyncio fetcher
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+# Retryable statuses whose Retry-After header is honoured, as urllib3's Retry does
+RETRY_AFTER_STATUSES = (429, 503)
+
+# Form fields and headers the calendar expects when posting for an event page
+DESCRIPTION_PAYLOAD = {
+    "__VIEWSTATE": "/wEPDwULLTEwNTgzNzY1NzBkZDQICa4hMSYrRs4a7jdi+yT15VZN5DU8w0EWlawDPo5a",
+    "__VIEWSTATEGENERATOR": "1174A9D5",
+    "__EVENTVALIDATION": "/wEdAAIPeOW34H8nx3Ya+gu/JAs/DJWw+FZ24ag06UaD5hLs0Xyi4Le7x6rZnlXPTnb3aKPCeWthpMBAs5uBG5TobT4V"
+}
+DESCRIPTION_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Append-only journal of fetched events inside the checkpoint directory, read by data-processing.py
+JOURNAL_FILE = "journal.jsonl"
+
+# Seconds after which an interrupted run's partial journal is no longer resumed
+JOURNAL_RESUME_MAX_AGE = 60 * 60
+
+# Event ids a run under --budget could not fetch, picked up first by the next run
+PENDING_FILE = "pending.json"
+
+# Days from today shown on the generated page, whose events are fetched first
+PRIORITY_DAYS = 7
+
+# Cached descriptions of events that book no court or start after PRIORITY_DAYS are kept this many times longer
+LOW_RELEVANCE_TTL_FACTOR = 4
+
+# Seconds of a --budget kept back for parsing, rendering and publishing after the describe stage
+PUBLISH_RESERVE = 30
+
+# Fast-path patterns for the <meta property="description" content="..."> tag of an event page
+META_TAG_PATTERN = re.compile(rb'<meta\b(?:[^>"\']|"[^"]*"|\'[^\']*\')*>', re.IGNORECASE)
+DESCRIPTION_PROPERTY_PATTERN = re.compile(rb'\bproperty\s*=\s*(?:"description"|\'description\'|description\b)', re.IGNORECASE)
+CONTENT_ATTRIBUTE_PATTERN = re.compile(rb'\bcontent\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+
+# Bytes read per chunk when streaming an event page
+DESCRIPTION_CHUNK_SIZE = 4096
+
+# Bytes of an event page still read after the description tag, so the HTTP/1.1
+# connection goes back to the pool; a longer page is cut off and its connection closed
+DESCRIPTION_DRAIN_LIMIT = 128 * 1024
+
+# Descriptions recorded by get_event_description when the event page could not be read
+DESCRIPTION_FAILURE_PREFIXES = ("Description not found.", "Failed with status code:", "Error occurred:")
+
+# Persistent description cache, one JSON object per line keyed by event_id
+DESCRIPTION_CACHE_FILE = "data/description_cache.jsonl"
+
+# Seconds a cached description is trusted before it is fetched again
+DESCRIPTION_TTL = 6 * 60 * 60
+
+# Seconds to wait for the calendar page, and for events to appear in its listing iframe
+SELENIUM_PAGE_TIMEOUT = 20
+SELENIUM_EVENTS_TIMEOUT = 10
+
+# Position of the month listing among the iframes embedded in the calendar page
+LISTING_IFRAME_INDEX = 3
+
+# Query parameter the Trumba-hosted 25Live publisher uses to pick the month shown
+MONTH_VIEW_PARAMETER = "trumbaEmbed"
+
+# Dates carrying a year in a 25Live description, e.g. "Monday, December 1, 2025"
+DESCRIPTION_DATE_PATTERN = re.compile(r'[A-Za-z]+, ([A-Za-z]+ \d+, \d{4})')
+
+def create_chrome_driver():
+    """Start a headless Chrome configured for reading the calendar."""
     # Set up Chrome options
     chrome_options = Options()
     chrome_options.add_argument("--headless=new")
@@ -29,84 +122,280 @@ def extract_event_urls(url):
     # Initialize the Chrome WebDriver
     driver = webdriver.Chrome(options=chrome_options)
     driver.set_window_size(1920, 1080)
-    
+    return driver
+
+class BrowserPool:
+    """
+    Small pool of warm headless browsers shared by concurrent month crawls.
+
+    Browsers are started on first use, so runs served by the HTTP extractor
+    never launch Chrome, and are kept between crawls until close(). A browser
+    that fails mid-crawl is quit and replaced on next use.
+    """
+
+    def __init__(self, size=2):
+        self.size = size
+        self.idle = queue.LifoQueue()
+        self.slots = threading.Semaphore(size)
+
+    @contextlib.contextmanager
+    def driver(self):
+        """Borrow a browser, starting one if none is idle. Blocks while all size browsers are in use."""
+        self.slots.acquire()
+        try:
+            try:
+                driver = self.idle.get_nowait()
+            except queue.Empty:
+                with metrics.timer("selenium_startup_seconds"):
+                    driver = create_chrome_driver()
+            healthy = False
+            try:
+                yield driver
+                driver.switch_to.default_content()
+                healthy = True
+            finally:
+                if healthy:
+                    self.idle.put(driver)
+                else:
+                    driver.quit()
+        finally:
+            self.slots.release()
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().quit()
+            except queue.Empty:
+                return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_month_events(driver):
+    """Read event links from the month view the driver has open."""
     event_links = []
+    for desc in driver.find_elements(By.CLASS_NAME, "twMonthEventDescription"):
+        try:
+            # Find the link element
+            link_element = desc.find_element(By.TAG_NAME, "a")
+            
+            # Store the information
+            event_links.append({
+                "title": link_element.text,
+                "url": link_element.get_attribute("href"),
+                "event_id": link_element.get_attribute("url.eventid")
+            })
+        except (NoSuchElementException, StaleElementReferenceException) as e:
+            print(f"Error extracting link: {str(e)}")
+            continue
+    return event_links
+
+def listing_loaded(driver):
+    """Wait condition: the embedded listing iframe or the events themselves are on the page."""
+    return (len(driver.find_elements(By.TAG_NAME, "iframe")) > LISTING_IFRAME_INDEX
+            or bool(driver.find_elements(By.CLASS_NAME, "twMonthEventDescription")))
+
+def extract_event_urls(url, driver=None):
+    """
+    Extract all event URLs from the 25Live calendar, handling iframe content.
+
+    Waits for the listing with explicit WebDriverWait conditions rather than fixed sleeps.
+
+    Args:
+        url (str): Calendar or month view URL
+        driver: Optional browser from a BrowserPool; a temporary one is started and quit if omitted
+
+    Returns:
+        list: Event dictionaries with title, url and event_id
+    """
+    if driver is None:
+        driver = create_chrome_driver()
+        try:
+            return extract_event_urls(url, driver)
+        finally:
+            # Close the browser
+            driver.quit()
+
+    # Navigate to the calendar URL
+    print(f"Navigating to {url}")
+    with metrics.timer("selenium_page_load_seconds"):
+        driver.get(url)
+        try:
+            WebDriverWait(driver, SELENIUM_PAGE_TIMEOUT).until(listing_loaded)
+        except TimeoutException:
+            print(f"Calendar did not load within {SELENIUM_PAGE_TIMEOUT} seconds")
+            return []
     
+    iframes = driver.find_elements(By.TAG_NAME, "iframe")
+    print(f"Found {len(iframes)} iframes")
+    if len(iframes) <= LISTING_IFRAME_INDEX:
+        print("Not enough iframes found - reading events directly")
+        event_links = read_month_events(driver)
+        print(f"Found {len(event_links)} event descriptions directly")
+        return event_links
+
+    print(f"Switching to the target iframe (index {LISTING_IFRAME_INDEX})")
+    with metrics.timer("selenium_iframe_wait_seconds"):
+        try:
+            WebDriverWait(driver, SELENIUM_PAGE_TIMEOUT).until(
+                EC.frame_to_be_available_and_switch_to_it(iframes[LISTING_IFRAME_INDEX]))
+            WebDriverWait(driver, SELENIUM_EVENTS_TIMEOUT).until(
+                EC.presence_of_element_located((By.CLASS_NAME, "twMonthEventDescription")))
+        except TimeoutException:
+            # An empty month never shows an event
+            print("No event descriptions appeared in the iframe")
+            return []
+    
+    event_links = read_month_events(driver)
+    print(f"Found {len(event_links)} event descriptions")
+    return event_links
+
+def month_cell_dates(soup, month_start):
+    """
+    Date of each day cell of a month view, keyed by id() of the cell.
+
+    The view shows whole weeks, so the cells before the 1st belong to the
+    previous month and the ones after the last day to the next month.
+    """
+    cell_dates = {}
+    offset, previous_day = 0, None
+    for cell in soup.find_all(class_="twMonthDay"):
+        number = cell.find(class_="twMonthDayNum")
+        text = number.get_text(strip=True) if number is not None else ""
+        if not text.isdigit():
+            continue
+        day = int(text)
+        if previous_day is None:
+            offset = 0 if day == 1 else -1
+        elif day < previous_day:
+            offset += 1
+        previous_day = day
+        year, month = divmod(month_start.year * 12 + month_start.month - 1 + offset, 12)
+        try:
+            cell_dates[id(cell)] = date(year, month + 1, day)
+        except ValueError:
+            continue
+    return cell_dates
+
+def parse_event_listing(html, base_url=CALENDAR_URL, month_start=None):
+    """
+    Parse event links out of 25Live month-view HTML.
+
+    Args:
+        html (str): Month-view HTML (the page itself or its calendar iframe)
+        base_url (str): URL the HTML was loaded from, used to resolve relative links
+        month_start (date): First day of the month shown; when given, each event gets a
+            listed_date (ISO date of the day cell it is listed in)
+
+    Returns:
+        list: Event dictionaries with title, url and event_id
+    """
+    # Only build a tree for the day cells and event description cells, not the whole page
+    strainer = SoupStrainer(class_=["twMonthDay", "twMonthEventDescription"])
+    soup = BeautifulSoup(html, "html.parser", parse_only=strainer)
+    cell_dates = month_cell_dates(soup, month_start) if month_start is not None else {}
+
+    event_links = []
+    for desc in soup.find_all(class_="twMonthEventDescription"):
+        link_element = desc.find("a")
+        if link_element is None:
+            continue
+
+        event_url = urljoin(base_url, link_element.get("href", ""))
+        event_id = link_element.get("url.eventid")
+        if not event_id:
+            event_id = parse_qs(urlparse(event_url).query).get("eventid", [None])[0]
+        if not event_id:
+            print(f"Error extracting link: no event id in {event_url}")
+            continue
+
+        event = {
+            "title": link_element.get_text(strip=True),
+            "url": event_url,
+            "event_id": event_id
+        }
+        cell = desc.find_parent(class_="twMonthDay")
+        if cell is not None and id(cell) in cell_dates:
+            event["listed_date"] = cell_dates[id(cell)].isoformat()
+        event_links.append(event)
+
+    return event_links
+
+def find_listing_frames(html, base_url=CALENDAR_URL):
+    """Return the absolute URLs of all iframes embedded in a calendar page."""
+    soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer("iframe"))
+    return [urljoin(base_url, frame["src"]) for frame in soup.find_all("iframe") if frame.get("src")]
+
+def request_timeout(deadline=None):
+    """REQUEST_TIMEOUT, cut down to what is left of an optional Deadline."""
+    remaining = deadline.remaining() if deadline is not None else None
+    return REQUEST_TIMEOUT if remaining is None else min(REQUEST_TIMEOUT, remaining)
+
+def extract_event_urls_http(url, session, listing_html=None, deadline=None, month_start=None):
+    """
+    Extract all event URLs from the 25Live calendar without starting a browser.
+
+    The month view is requested over the shared session and parsed directly.
+    If the events are rendered inside an iframe, each embedded frame is fetched
+    in turn until one of them contains the event listing.
+
+    Args:
+        url (str): Calendar URL
+        session: Requests session with retry configuration
+        listing_html (str): Optional path to a saved month-view HTML file;
+            when given no network requests are made
+        deadline (Deadline): Optional budget; no request is started once it has expired, and each
+            attempt times out when it does (the session's retries of one request are not cut short)
+        month_start (date): First day of the month shown, passed on to parse_event_listing
+
+    Returns:
+        list: Event dictionaries with title, url and event_id
+    """
+    if listing_html:
+        print(f"Reading saved calendar listing from {listing_html}")
+        with open(listing_html, 'r', encoding='utf-8') as f:
+            return parse_event_listing(f.read(), url, month_start)
+
+    if deadline is not None and deadline.expired():
+        print(f"Deadline reached - not requesting {url}")
+        return []
+    print(f"Requesting {url}")
     try:
-        # Navigate to the calendar URL
-        print(f"Navigating to {url}")
-        driver.get(url)
-        
-        # Use a longer wait time for initial load
-        print("Waiting for page to load...")
-        time.sleep(8)
-        
-        # Try to find all iframes
-        iframes = driver.find_elements(By.TAG_NAME, "iframe")
-        print(f"Found {len(iframes)} iframes")
-        
-        if len(iframes) >= 4:
-            try:
-                print("Switching to the target iframe (index 3)")
-                driver.switch_to.frame(iframes[3])
-                
-                # Use a generous wait time to find the event elements
-                time.sleep(5)
-                
-                # Now try to find the event descriptions
-                event_descriptions = driver.find_elements(By.CLASS_NAME, "twMonthEventDescription")
-                print(f"Found {len(event_descriptions)} event descriptions")
-                
-                for desc in event_descriptions:
-                    try:
-                        # Find the link element
-                        link_element = desc.find_element(By.TAG_NAME, "a")
-                        
-                        # Extract event information
-                        event_url = link_element.get_attribute("href")
-                        event_id = link_element.get_attribute("url.eventid")
-                        event_title = link_element.text
-                        
-                        # Store the information
-                        event_links.append({
-                            "title": event_title,
-                            "url": event_url,
-                            "event_id": event_id
-                        })
-                    except Exception as e:
-                        print(f"Error extracting link: {str(e)}")
-                        continue
-            except Exception as e:
-                print(f"Error processing iframe: {str(e)}")
-        else:
-            print("Not enough iframes found - trying to find events directly")
-            try:
-                event_descriptions = driver.find_elements(By.CLASS_NAME, "twMonthEventDescription")
-                if event_descriptions:
-                    print(f"Found {len(event_descriptions)} event descriptions directly")
-                    for desc in event_descriptions:
-                        try:
-                            link_element = desc.find_element(By.TAG_NAME, "a")
-                            event_url = link_element.get_attribute("href")
-                            event_id = link_element.get_attribute("url.eventid")
-                            event_title = link_element.text
-                            
-                            event_links.append({
-                                "title": event_title,
-                                "url": event_url,
-                                "event_id": event_id
-                            })
-                        except Exception as e:
-                            print(f"Error extracting link: {str(e)}")
-                            continue
-            except Exception as e:
-                print(f"Error finding events directly: {str(e)}")
-        
+        with metrics.timer("listing_request_seconds"):
+            response = session.get(url, timeout=request_timeout(deadline))
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Error requesting calendar: {str(e)}")
+        return []
+
+    event_links = parse_event_listing(response.text, response.url, month_start)
+    if event_links:
+        print(f"Found {len(event_links)} event descriptions")
         return event_links
-        
-    finally:
-        # Close the browser
-        driver.quit()
+
+    frames = find_listing_frames(response.text, response.url)
+    print(f"No events in page - checking {len(frames)} iframes")
+    for frame_url in frames:
+        if deadline is not None and deadline.expired():
+            print("Deadline reached - not checking the remaining iframes")
+            break
+        try:
+            with metrics.timer("listing_request_seconds"):
+                frame_response = session.get(frame_url, timeout=request_timeout(deadline))
+            frame_response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"Error requesting iframe {frame_url}: {str(e)}")
+            continue
+
+        event_links = parse_event_listing(frame_response.text, frame_response.url, month_start)
+        if event_links:
+            print(f"Found {len(event_links)} event descriptions in iframe {frame_url}")
+            return event_links
+
+    return []
 
 def create_session_with_retries():
     """Create a requests session with automatic retries."""
@@ -114,9 +403,9 @@ def create_session_with_retries():
     
     # Configure automatic retries with backoff
     retries = Retry(
-        total=5,
-        backoff_factor=0.5,
-        status_forcelist=[429, 500, 502, 503, 504],
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
         allowed_methods=["GET", "POST"]
     )
     
@@ -124,144 +413,1020 @@ def create_session_with_retries():
     adapter = HTTPAdapter(max_retries=retries, pool_connections=50, pool_maxsize=50)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
-    
-    # Set default timeout
-    session.timeout = 15
-    
+
+    # requests has no session-wide timeout: every call passes timeout=REQUEST_TIMEOUT
     return session
 
-def get_event_description(session, event_info):
+class Deadline:
+    """Time budget for a run; Deadline(None) never expires."""
+
+    def __init__(self, seconds=None):
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self):
+        """Seconds left, or None without a budget - usable directly as a wait timeout."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self):
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def reserve(self, seconds):
+        """A deadline that expires the given number of seconds before this one."""
+        deadline = Deadline()
+        if self.expires_at is not None:
+            deadline.expires_at = self.expires_at - seconds
+        return deadline
+
+def description_end_date(description):
+    """Return the last date mentioned in an event description, or None."""
+    dates = DESCRIPTION_DATE_PATTERN.findall(description or "")
+    if not dates:
+        return None
+    try:
+        return datetime.strptime(dates[-1], '%B %d, %Y').date()
+    except ValueError:
+        return None
+
+def is_cache_entry_fresh(entry, ttl=DESCRIPTION_TTL, now=None, today=None):
+    """
+    Return True if a cache entry may still be served.
+
+    Entries expire once their event has taken place or their TTL has passed.
+    Events that book no court or start after the next PRIORITY_DAYS days are
+    refreshed LOW_RELEVANCE_TTL_FACTOR times less often. Each entry's TTL is
+    stretched by up to 25% (derived from its event_id) so descriptions cached
+    together don't all expire in the same run.
+    """
+    now = time.time() if now is None else now
+    today = datetime.now().date().isoformat() if today is None else today
+    if entry.get("end_date") and entry["end_date"] < today:
+        return False
+    if not is_relevant_entry(entry, today):
+        ttl *= LOW_RELEVANCE_TTL_FACTOR
+    jitter = (zlib.crc32(entry["event_id"].encode()) % 1000) / 4000
+    return now - entry["fetched_at"] <= ttl * (1 + jitter)
+
+def is_relevant_entry(entry, today):
+    """Return True if a cache entry books a court within PRIORITY_DAYS of today (an ISO date)."""
+    if "courts" not in entry:
+        # Cached before courts were recorded
+        return True
+    if not entry["courts"]:
+        return False
+    window_end = (date.fromisoformat(today) + timedelta(days=PRIORITY_DAYS)).isoformat()
+    return entry.get("start_date") is None or entry["start_date"] < window_end
+
+def evict_stale_descriptions(cache, ttl=DESCRIPTION_TTL):
+    """Drop expired entries from an in-memory cache, for processes that keep it between runs."""
+    now = time.time()
+    today = datetime.now().date().isoformat()
+    stale = [event_id for event_id, entry in cache.items() if not is_cache_entry_fresh(entry, ttl, now, today)]
+    for event_id in stale:
+        del cache[event_id]
+    return len(stale)
+
+def load_description_cache(filename=DESCRIPTION_CACHE_FILE, ttl=DESCRIPTION_TTL):
+    """
+    Load the persistent description cache, evicting entries that are no longer fresh.
+
+    Returns:
+        dict: event_id -> cache entry (title, description, fetched_at, end_date, start_date, courts)
+    """
+    cache = {}
+    if not os.path.exists(filename):
+        return cache
+
+    now = time.time()
+    today = datetime.now().date().isoformat()
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if is_cache_entry_fresh(entry, ttl, now, today):
+                cache[entry["event_id"]] = entry
+
+    print(f"Loaded {len(cache)} fresh cached descriptions from {filename}")
+    return cache
+
+def save_description_cache(cache, filename=DESCRIPTION_CACHE_FILE):
+    """Write the description cache back to disk, replacing the previous file atomically."""
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, 'w', encoding='utf-8') as f:
+        for entry in cache.values():
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    os.replace(tmp_filename, filename)
+
+    print(f"Saved {len(cache)} cached descriptions to {filename}")
+
+def get_cached_description(cache, event_info):
+    """
+    Return the cached description for an event, or None if it must be fetched.
+
+    Besides the TTL applied in load_description_cache, an entry is treated as
+    stale when the calendar now lists the event under a different title.
+    """
+    entry = cache.get(event_info["event_id"]) if cache is not None else None
+    if entry is None or entry.get("title") != event_info.get("title"):
+        return None
+    return entry["description"]
+
+def cache_description(cache, event_info):
+    """Store a successfully fetched description in the cache."""
+    end_date = description_end_date(event_info["description"])
+    parsed_events = parse_description(event_info["description"])
+    cache[event_info["event_id"]] = {
+        "event_id": event_info["event_id"],
+        "title": event_info.get("title"),
+        "description": event_info["description"],
+        "fetched_at": event_info.get("fetched_at", time.time()),
+        "end_date": end_date.isoformat() if end_date else None,
+        "start_date": min(parsed["date"] for parsed in parsed_events).isoformat() if parsed_events else None,
+        "courts": sorted(set().union(*(booked_courts(parsed["location"]) for parsed in parsed_events)))
+    }
+
+def get_event_description(session, event_info, cache=None, url=CALENDAR_URL):
     """
     Fetches the event description for a given event using a shared session.
+    Only new or stale events hit the network when a description cache is given.
     
     Args:
         session: Requests session with retry configuration
         event_info (dict): Dictionary containing event information.
+        cache (dict): Optional description cache from load_description_cache
+        url (str): Calendar URL
     
     Returns:
-        dict: Updated event info with description.
+        dict: Updated event info with description, and fetched_at (epoch seconds the
+        description was fetched, possibly by an earlier run) when it was fetched.
     """
-    event_id = event_info["event_id"]
-    url = "https://25livepub.collegenet.com/calendars/25live-woodpec-cal"
-
-    # POST request payload
-    payload = {
-        "__VIEWSTATE": "/wEPDwULLTEwNTgzNzY1NzBkZDQICa4hMSYrRs4a7jdi+yT15VZN5DU8w0EWlawDPo5a",
-        "__VIEWSTATEGENERATOR": "1174A9D5",
-        "__EVENTVALIDATION": "/wEdAAIPeOW34H8nx3Ya+gu/JAs/DJWw+FZ24ag06UaD5hLs0Xyi4Le7x6rZnlXPTnb3aKPCeWthpMBAs5uBG5TobT4V"
-    }
+    cached_description = get_cached_description(cache, event_info)
+    if cached_description is not None:
+        metrics.increment("description_cache_hits_total", fetcher="threads")
+        event_info["description"] = cached_description
+        event_info["fetched_at"] = cache[event_info["event_id"]]["fetched_at"]
+        return event_info
 
-    # Headers
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+    event_id = event_info["event_id"]
+    start = time.perf_counter()
 
     try:
-        response = session.post(f"{url}?eventid={event_id}", headers=headers, data=payload)
+        response = session.post(f"{url}?eventid={event_id}", headers=DESCRIPTION_HEADERS, data=DESCRIPTION_PAYLOAD,
+                                stream=True, timeout=REQUEST_TIMEOUT)
+        # Retries made by the session's urllib3 Retry policy before this response
+        retries = response.raw.retries
+        if retries is not None and retries.history:
+            metrics.increment("description_retries_total", len(retries.history), fetcher="threads")
+        metrics.increment("description_responses_total", fetcher="threads", status=response.status_code)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, "html.parser")
-            meta_tag = soup.find("meta", {"property": "description"})
+            # Stop scanning the page as soon as the description tag has been seen
+            scanner = DescriptionScanner()
+            with response:
+                chunks = response.iter_content(DESCRIPTION_CHUNK_SIZE)
+                for chunk in chunks:
+                    if scanner.feed(chunk):
+                        break
+                drain(chunks)
+            description = scanner.finish()
             
-            if meta_tag and "content" in meta_tag.attrs:
-                event_info["description"] = meta_tag["content"]
+            if description is not None:
+                event_info["description"] = description
+                event_info["fetched_at"] = time.time()
+                if cache is not None:
+                    cache_description(cache, event_info)
             else:
                 event_info["description"] = "Description not found."
         else:
+            with response:
+                drain(response.iter_content(DESCRIPTION_CHUNK_SIZE))
             event_info["description"] = f"Failed with status code: {response.status_code}"
 
     except Exception as e:
+        metrics.increment("description_errors_total", fetcher="threads")
         event_info["description"] = f"Error occurred: {str(e)}"
     
+    metrics.observe("description_request_seconds", time.perf_counter() - start, fetcher="threads")
     return event_info
 
-def process_event_batch(args):
-    """Process a batch of events with a shared session."""
-    batch_id, event_batch, checkpoint_file = args
-    
-    # Create a shared session for all requests in this batch
-    session = create_session_with_retries()
-    
-    results = []
-    
-    # Process each event in the batch with progress bar
-    for event in tqdm(event_batch, desc=f"Batch {batch_id}", position=batch_id):
-        result = get_event_description(session, event)
-        results.append(result)
-        
-        # Save incremental checkpoint after every 10 events
-        if len(results) % 10 == 0:
-            with open(checkpoint_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, ensure_ascii=False, indent=2)
-    
-    # Final checkpoint save
-    with open(checkpoint_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=2)
-    
+def drain(chunks):
+    """
+    Read the rest of a streamed response body, up to DESCRIPTION_DRAIN_LIMIT bytes, without looking at it.
+
+    An HTTP/1.1 connection can only be reused once its response has been read to
+    the end; closing the response earlier closes the connection too.
+
+    Returns:
+        bool: True if the body was read to the end
+    """
+    drained = 0
+    for chunk in chunks:
+        drained += len(chunk)
+        if drained > DESCRIPTION_DRAIN_LIMIT:
+            return False
+    return True
+
+async def drain_async(chunks):
+    """Asyncio counterpart of drain."""
+    drained = 0
+    async for chunk in chunks:
+        drained += len(chunk)
+        if drained > DESCRIPTION_DRAIN_LIMIT:
+            return False
+    return True
+
+def scan_description(data, start=0):
+    """
+    Fast path: find the description meta tag in (possibly partial) event page bytes.
+
+    Returns:
+        str: Unescaped tag content, or None if no complete description tag was found
+    """
+    for match in META_TAG_PATTERN.finditer(data, start):
+        tag = match.group(0)
+        if DESCRIPTION_PROPERTY_PATTERN.search(tag):
+            content = CONTENT_ATTRIBUTE_PATTERN.search(tag)
+            if content:
+                value = content.group(1) if content.group(1) is not None else content.group(2)
+                return html.unescape(value.decode("utf-8", errors="replace"))
+    return None
+
+def parse_description_soup(data):
+    """Slow path: read the description meta tag from a full BeautifulSoup tree."""
+    soup = BeautifulSoup(data, "html.parser")
+    meta_tag = soup.find("meta", {"property": "description"})
+    if meta_tag and "content" in meta_tag.attrs:
+        return meta_tag["content"]
+    return None
+
+class DescriptionScanner:
+    """
+    Incrementally scan a streamed event page for its description meta tag.
+
+    feed() returns True once the tag has been found, so the caller can stop
+    reading the body. finish() returns the description, falling back to
+    BeautifulSoup over the whole page when the fast path found nothing.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.description = None
+
+    def feed(self, chunk):
+        # Rescan a little of the previous data in case a tag straddles two chunks
+        start = max(0, len(self.buffer) - DESCRIPTION_CHUNK_SIZE)
+        self.buffer += chunk
+        self.description = scan_description(self.buffer, start)
+        return self.description is not None
+
+    def finish(self):
+        if self.description is None:
+            self.description = parse_description_soup(bytes(self.buffer))
+        return self.description
+
+def extract_description(page):
+    """
+    Return the content of the description meta tag of an event page (str or bytes), or None.
+
+    The page is fed in DESCRIPTION_CHUNK_SIZE chunks, stopping at the tag, exactly as the fetchers stream it.
+    """
+    if isinstance(page, str):
+        page = page.encode("utf-8")
+    scanner = DescriptionScanner()
+    for start in range(0, len(page), DESCRIPTION_CHUNK_SIZE):
+        if scanner.feed(page[start:start + DESCRIPTION_CHUNK_SIZE]):
+            break
+    return scanner.finish()
+
+class TokenBucket:
+    """Token bucket limiting how many requests per second the asyncio fetcher may start."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class AdaptiveConcurrency:
+    """
+    AIMD limit on how many description requests the asyncio fetcher keeps in flight.
+
+    After every window of `limit` successful requests the limit grows by one,
+    as long as the window's p95 latency stayed within LATENCY_TOLERANCE times
+    the best window p50 seen so far and all `limit` slots were in use at some
+    point during the window. A window that never filled the limit, because the
+    rate limit or the listing was the bottleneck, says nothing about whether
+    the server could take more and leaves the limit unchanged. The limit is
+    multiplied by DECREASE_FACTOR as soon as a request is throttled (429),
+    fails with a retryable 5xx or a transport error, or a window's p95 exceeds
+    that bound. Requests that
+    started before the last decrease are ignored, since they report the load
+    that caused it, so one overloaded moment does not collapse the limit to
+    the minimum. With minimum == maximum it is a plain fixed limit.
+    """
+
+    LATENCY_TOLERANCE = 3.0
+    DECREASE_FACTOR = 0.5
+
+    def __init__(self, initial=8, minimum=1, maximum=64):
+        self.minimum = minimum
+        self.maximum = max(maximum, minimum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.peak = self.limit
+        self.in_flight = 0
+        self.window = []
+        # Most requests in flight at once since the window started
+        self.window_peak = 0
+        self.baseline = None
+        self.decreased_at = float("-inf")
+        self.condition = None
+        metrics.set_gauge("description_concurrency_limit", self.limit)
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        """Hold one of the limit's slots for the duration of the with-block."""
+        if self.condition is None:
+            # Created lazily so it binds to the running event loop
+            self.condition = asyncio.Condition()
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            self.window_peak = max(self.window_peak, self.in_flight)
+        try:
+            yield
+        finally:
+            async with self.condition:
+                self.in_flight -= 1
+                self.condition.notify_all()
+
+    def record(self, latency, ok):
+        """Feed back one finished request. Call it before leaving slot() so waiters see a raised limit."""
+        if time.monotonic() - latency < self.decreased_at:
+            return
+        if not ok:
+            self._decrease("throttled or failing")
+            return
+
+        self.window.append(latency)
+        if len(self.window) < self.limit:
+            return
+        ordered = sorted(self.window)
+        p50 = ordered[len(ordered) // 2]
+        p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+        self.baseline = p50 if self.baseline is None else min(self.baseline, p50)
+        saturated = self.window_peak >= self.limit
+        self._new_window()
+        if p95 > self.baseline * self.LATENCY_TOLERANCE:
+            self._decrease(f"p95 {p95 * 1000:.0f} ms over {self.baseline * self.LATENCY_TOLERANCE * 1000:.0f} ms")
+        elif saturated:
+            self._set_limit(self.limit + 1, f"p95 {p95 * 1000:.0f} ms")
+
+    def _new_window(self):
+        self.window = []
+        self.window_peak = self.in_flight
+
+    def _decrease(self, reason):
+        self.decreased_at = time.monotonic()
+        self._new_window()
+        self._set_limit(int(self.limit * self.DECREASE_FACTOR), reason)
+
+    def _set_limit(self, limit, reason):
+        limit = min(max(limit, self.minimum), self.maximum)
+        if limit == self.limit:
+            return
+        if limit < self.limit:
+            print(f"Concurrency limit {self.limit} -> {limit} ({reason})")
+        self.limit = limit
+        self.peak = max(self.peak, limit)
+        metrics.set_gauge("description_concurrency_limit", limit)
+
+def retry_after_seconds(value):
+    """Seconds a Retry-After header asks to wait, given as seconds or an HTTP date; 0 if absent or invalid."""
+    if not value:
+        return 0
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+def retry_delay(attempt, response=None):
+    """
+    Seconds to wait before retrying after the given (0-based) failed attempt.
+
+    Matches the urllib3 Retry policy of create_session_with_retries: no wait
+    before the first retry, then RETRY_BACKOFF_FACTOR * 2 ** attempt (1, 2, 4,
+    8 seconds), except that a Retry-After header on a 429 or 503 is waited
+    out instead.
+    """
+    if response is not None and response.status_code in RETRY_AFTER_STATUSES:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            return retry_after_seconds(retry_after)
+    return RETRY_BACKOFF_FACTOR * (2 ** attempt) if attempt else 0.0
+
+async def get_event_description_async(client, event_info, limiter, bucket, cache=None, url=CALENDAR_URL):
+    """
+    Asyncio counterpart of get_event_description.
+
+    Retries transport errors and RETRY_STATUSES responses up to RETRY_TOTAL
+    times, waiting as long as the requests session would (see retry_delay).
+
+    Args:
+        client: Shared httpx.AsyncClient
+        event_info (dict): Dictionary containing event information.
+        limiter: AdaptiveConcurrency bounding in-flight requests
+        bucket: TokenBucket bounding the request rate
+        cache (dict): Optional description cache from load_description_cache
+        url (str): Calendar URL
+
+    Returns:
+        dict: Updated event info with description, and fetched_at (epoch seconds the
+        description was fetched, possibly by an earlier run) when it was fetched.
+    """
+    cached_description = get_cached_description(cache, event_info)
+    if cached_description is not None:
+        metrics.increment("description_cache_hits_total", fetcher="async")
+        event_info["description"] = cached_description
+        event_info["fetched_at"] = cache[event_info["event_id"]]["fetched_at"]
+        return event_info
+
+    for attempt in range(RETRY_TOTAL + 1):
+        if attempt:
+            metrics.increment("description_retries_total", fetcher="async")
+        await bucket.acquire()
+        response = None
+        error = None
+        scanner = DescriptionScanner()
+        async with limiter.slot():
+            # Timed inside the slot so latency reflects the server, not queueing
+            start = time.perf_counter()
+            try:
+                async with client.stream("POST", url, params={"eventid": event_info["event_id"]},
+                                         data=DESCRIPTION_PAYLOAD) as response:
+                    chunks = response.aiter_bytes(DESCRIPTION_CHUNK_SIZE)
+                    if response.status_code == 200:
+                        # Stop scanning the page as soon as the description tag has been seen
+                        async for chunk in chunks:
+                            if scanner.feed(chunk):
+                                break
+                    # Closing an HTTP/2 stream early only resets that stream
+                    if response.http_version != "HTTP/2":
+                        await drain_async(chunks)
+            except httpx.TransportError as e:
+                error = e
+            latency = time.perf_counter() - start
+            metrics.observe("description_request_seconds", latency, fetcher="async")
+            limiter.record(latency, ok=error is None and response.status_code not in RETRY_STATUSES)
+
+        if error is not None:
+            metrics.increment("description_errors_total", fetcher="async")
+            event_info["description"] = f"Error occurred: {str(error)}"
+        else:
+            metrics.increment("description_responses_total", fetcher="async", status=response.status_code)
+            if response.status_code == 200:
+                description = scanner.finish()
+                if description is not None:
+                    event_info["description"] = description
+                    event_info["fetched_at"] = time.time()
+                    if cache is not None:
+                        cache_description(cache, event_info)
+                else:
+                    event_info["description"] = "Description not found."
+                return event_info
+            event_info["description"] = f"Failed with status code: {response.status_code}"
+            if response.status_code not in RETRY_STATUSES:
+                return event_info
+
+        if attempt < RETRY_TOTAL:
+            await asyncio.sleep(retry_delay(attempt, response))
+
+    return event_info
+
+async def fetch_descriptions_async(event_links, cache=None, concurrency=16, rate=20.0, url=CALENDAR_URL, http2=True,
+                                   on_result=None, max_concurrency=None, deadline=None):
+    """
+    Fetch descriptions for all events over one shared HTTP/2 connection pool.
+
+    Args:
+        event_links (list): Event dictionaries with title, url and event_id
+        cache (dict): Optional description cache from load_description_cache
+        concurrency (int): Number of requests in flight to start with
+        max_concurrency (int): Upper bound the adaptive limit may ramp up to; None keeps the limit fixed at concurrency
+        rate (float): Maximum number of requests started per second
+        url (str): Calendar URL, overridable to point at a local server
+        http2 (bool): Negotiate HTTP/2 where the server supports it
+        on_result (callable): Optional callback invoked with each finished event
+        deadline (Deadline): Optional budget; requests still pending when it expires are cancelled
+
+    Returns:
+        list: Updated event dictionaries, in the order given, without the events cancelled at the deadline
+    """
+    if max_concurrency is None:
+        limiter = AdaptiveConcurrency(concurrency, concurrency, concurrency)
+    else:
+        limiter = AdaptiveConcurrency(concurrency, 1, max_concurrency)
+    bucket = TokenBucket(rate)
+    limits = httpx.Limits(max_connections=limiter.maximum, max_keepalive_connections=limiter.maximum)
+
+    async with httpx.AsyncClient(http2=http2, limits=limits, timeout=REQUEST_TIMEOUT, headers=DESCRIPTION_HEADERS) as client:
+        with tqdm(total=len(event_links), desc="Descriptions") as progress:
+            async def fetch(event):
+                result = await get_event_description_async(client, event, limiter, bucket, cache, url)
+                progress.set_postfix(limit=limiter.limit, refresh=False)
+                progress.update(1)
+                if on_result is not None:
+                    on_result(result)
+                return result
+
+            tasks = [asyncio.ensure_future(fetch(event)) for event in event_links]
+            if not tasks:
+                return []
+            done, unfinished = await asyncio.wait(tasks, timeout=deadline.remaining() if deadline else None)
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                await asyncio.gather(*unfinished, return_exceptions=True)
+                print(f"Deadline reached - cancelled {len(unfinished)} description requests")
+            results = [task.result() for task in tasks if task in done]
+
+    if max_concurrency is not None:
+        print(f"Concurrency limit ended at {limiter.limit} (peak {limiter.peak}, range {limiter.minimum}-{limiter.maximum})")
     return results
 
-def split_into_batches(items, num_batches):
-    """Split items into num_batches as evenly as possible."""
-    avg_size = len(items) // num_batches
-    remainder = len(items) % num_batches
-    
-    result = []
-    start = 0
-    
-    for i in range(num_batches):
-        # Add one extra item to the first 'remainder' batches
-        end = start + avg_size + (1 if i < remainder else 0)
-        result.append(items[start:end])
-        start = end
-    
-    return result
+def process_event_queue(event_links, num_workers=4, cache=None, url=CALENDAR_URL, on_result=None, deadline=None):
+    """
+    Fetch descriptions with worker threads pulling events from a shared queue.
+
+    Each worker takes the next event as soon as it finishes the previous one,
+    so a slow or retrying request only delays itself instead of a whole batch.
+
+    Args:
+        event_links (list): Event dictionaries with title, url and event_id
+        num_workers (int): Number of worker threads, each with its own session
+        cache (dict): Optional description cache from load_description_cache
+        url (str): Calendar URL, overridable to point at a local server
+        on_result (callable): Optional callback invoked with each finished event
+        deadline (Deadline): Optional budget; events not finished when it expires are left out
+
+    Returns:
+        list: Updated event dictionaries, in the order given
+    """
+    work_queue = queue.Queue()
+    for index, event in enumerate(event_links):
+        work_queue.put((index, event))
+
+    results = [None] * len(event_links)
+    progress = tqdm(total=len(event_links), desc="Descriptions")
+    # Set at the deadline; requests still in flight then finish in the background and are dropped
+    stopped = threading.Event()
+    results_lock = threading.Lock()
+    # Workers fill a copy of the cache, so requests finishing after the deadline never touch the caller's
+    run_cache = dict(cache) if cache is not None else None
+
+    def worker():
+        session = create_session_with_retries()
+        while not stopped.is_set():
+            try:
+                index, event = work_queue.get_nowait()
+            except queue.Empty:
+                return
+            result = get_event_description(session, dict(event), run_cache, url)
+            with results_lock:
+                if stopped.is_set():
+                    return
+                results[index] = result
+                progress.update(1)
+                if on_result is not None:
+                    on_result(result)
+
+    def run_worker():
+        try:
+            worker()
+        except Exception as exc:
+            print(f"Worker generated an exception: {exc}")
+
+    # Daemon threads, so a worker still inside a request at the deadline does not hold up the process exit
+    threads = [threading.Thread(target=run_worker, daemon=True) for _ in range(num_workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(deadline.remaining() if deadline else None)
+    with results_lock:
+        stopped.set()
+    if any(thread.is_alive() for thread in threads):
+        print(f"Deadline reached - dropping {results.count(None)} unfinished events")
+    progress.close()
+
+    kept = [result for result in results if result is not None]
+    if cache is not None:
+        for result in kept:
+            if result["event_id"] in run_cache:
+                cache[result["event_id"]] = run_cache[result["event_id"]]
+    return kept
+
+def is_fetched_description(description):
+    """Return True if a description came from the event page rather than a failed request."""
+    return bool(description) and not description.startswith(DESCRIPTION_FAILURE_PREFIXES)
+
+class CheckpointJournal:
+    """
+    Append-only JSON-lines journal of fetched events for one run.
+
+    Events are appended to JOURNAL_FILE's ".partial" sibling as they finish and
+    fsynced every FSYNC_EVERY records. commit() renames the partial journal over
+    the completed one, so readers only ever see a finished run. A partial
+    journal left behind by an interrupted run is resumed: its successfully
+    fetched events are not requested again.
+    """
+
+    FSYNC_EVERY = 25
+
+    def __init__(self, checkpoint_dir="checkpoints"):
+        self.filename = os.path.join(checkpoint_dir, JOURNAL_FILE)
+        self.partial_filename = f"{self.filename}.partial"
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.resumed = read_journal(self.partial_filename) if self._can_resume() else {}
+        self.file = open(self.partial_filename, 'a' if self.resumed else 'w', encoding='utf-8')
+
+    def _can_resume(self):
+        if not os.path.exists(self.partial_filename):
+            return False
+        age = time.time() - os.path.getmtime(self.partial_filename)
+        return age <= JOURNAL_RESUME_MAX_AGE
+
+    def completed(self, event_info):
+        """Return the journaled copy of an event fetched by the interrupted run, or None."""
+        record = self.resumed.get(event_info["event_id"])
+        if record is None or not is_fetched_description(record.get("description")):
+            return None
+        return record
+
+    def append(self, event_info):
+        with self.lock:
+            self.file.write(json.dumps(event_info, ensure_ascii=False) + "\n")
+            self.file.flush()
+            self.pending += 1
+            if self.pending >= self.FSYNC_EVERY:
+                os.fsync(self.file.fileno())
+                self.pending = 0
+
+    def commit(self, results, rewrite=False):
+        """
+        Make this run's journal the completed one.
+
+        Args:
+            results (list): Every event of the run, in listing order
+            rewrite (bool): Write results out even if the journal was not resumed,
+                e.g. when it holds events carried over from the previous run
+        """
+        with self.lock:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+
+            if self.resumed or rewrite:
+                # Resumed journals can hold an event twice (failed, then refetched) - rewrite once
+                with open(self.partial_filename, 'w', encoding='utf-8') as f:
+                    for event_info in results:
+                        f.write(json.dumps(event_info, ensure_ascii=False) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            os.replace(self.partial_filename, self.filename)
+
+def read_journal(filename):
+    """Read a journal into an event_id -> event dict, later records winning."""
+    return {record["event_id"]: record for record in iter_journal(filename)}
+
+def listing_unchanged(event_links, cache, checkpoint_dir="checkpoints"):
+    """
+    Return True if the last completed journal already holds exactly these events,
+    each with the description the cache would serve, so there is nothing to fetch or write.
+    """
+    filename = os.path.join(checkpoint_dir, JOURNAL_FILE)
+    if cache is None or not os.path.exists(filename) or os.path.exists(f"{filename}.partial"):
+        return False
+
+    journaled = read_journal(filename)
+    if len(journaled) != len(event_links):
+        return False
+    for event in event_links:
+        record = journaled.get(event["event_id"])
+        if record is None or record.get("title") != event.get("title"):
+            return False
+        if record.get("description") != get_cached_description(cache, event):
+            return False
+    return True
+
+def description_courts(description):
+    """Courts an event books on any of its days, from its description."""
+    parsed_events = parse_description(description) if is_fetched_description(description) else []
+    return set().union(*(booked_courts(parsed["location"]) for parsed in parsed_events))
+
+def event_priority(description, today=None, days=PRIORITY_DAYS):
+    """
+    Rank an event for fetching by how much its last known description matters to the page.
+
+    Returns:
+        int: 0 if it books DISPLAY_COURT within the next `days` days (what index.html shows),
+        1 if it books another court then, 2 if it books a court later, 3 if it books
+        no court or is over; None if there is no parsable description
+    """
+    parsed_events = parse_description(description) if is_fetched_description(description) else []
+    if not parsed_events:
+        return None
+    today = today or date.today()
+    window_end = today + timedelta(days=days)
+    priority = 3
+    for parsed in parsed_events:
+        courts = booked_courts(parsed["location"])
+        if parsed["date"] < today or not courts:
+            continue
+        if parsed["date"] >= window_end:
+            priority = min(priority, 2)
+        elif DISPLAY_COURT in courts:
+            return 0
+        else:
+            priority = min(priority, 1)
+    return priority
+
+def prioritize_events(event_links, previous, cache=None, carried_ids=()):
+    """
+    Order events so the ones likely to book the displayed court in the displayed window are fetched first.
+
+    An event is ranked by event_priority on the last description known for it -
+    the cached one, else the previous run's journal. An event without one is
+    ranked by hints: whether its title has booked courts before (unseen titles
+    are assumed to) and the days it was listed on in the month view - after
+    the window, or only before today, ranks it below events listed inside the
+    window. Without day hints (the Selenium listing) the month view it was
+    listed in is used instead. Within a rank, events the previous run could
+    not fetch in time go first, then listing order.
 
-def process_with_checkpoints(event_links, num_workers=4, checkpoint_dir="checkpoints"):
-    """Process events with checkpointing and parallel execution."""
+    Args:
+        event_links (list): Event dictionaries with title, url and event_id
+        previous (dict): event_id -> record from the last completed journal
+        cache (dict): Optional description cache
+        carried_ids: Event ids left unfinished by the previous run
+
+    Returns:
+        list: The same events, reordered
+    """
+    today = date.today()
+    window_start = today.isoformat()
+    window_end = (today + timedelta(days=PRIORITY_DAYS)).isoformat()
+    carried_ids = set(carried_ids)
+
+    title_books_courts = {}
+    for record in previous.values():
+        books_courts = bool(description_courts(record.get("description")))
+        title_books_courts[record.get("title")] = title_books_courts.get(record.get("title"), False) or books_courts
+
+    def rank(item):
+        index, event = item
+        entry = cache.get(event["event_id"]) if cache is not None else None
+        record = entry or previous.get(event["event_id"]) or {}
+        priority = event_priority(record.get("description"), today)
+        if priority is None:
+            listed_date = event.get("listed_date")
+            if not title_books_courts.get(event.get("title"), True):
+                priority = 3
+            elif listed_date:
+                listed_until = event.get("listed_until", listed_date)
+                priority = 2 if listed_date >= window_end or listed_until < window_start else 1
+            elif event.get("listed_month", "") >= window_end:
+                priority = 2
+            else:
+                priority = 1
+        return priority, event["event_id"] not in carried_ids, index
+
+    ranked = sorted(enumerate(event_links), key=rank)
+    return [event for _, event in ranked]
+
+def load_pending(checkpoint_dir="checkpoints"):
+    """Event ids the previous run left unfinished, or an empty list."""
+    try:
+        with open(os.path.join(checkpoint_dir, PENDING_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+def save_pending(event_ids, checkpoint_dir="checkpoints"):
+    """Record unfinished event ids for the next run, removing the file once there are none."""
+    filename = os.path.join(checkpoint_dir, PENDING_FILE)
+    if not event_ids:
+        if os.path.exists(filename):
+            os.remove(filename)
+        return
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(event_ids, f)
+
+def process_with_checkpoints(event_links, num_workers=4, checkpoint_dir="checkpoints", cache=None,
+                             fetcher="async", concurrency=16, rate=20.0, max_concurrency=None, deadline=None,
+                             store_file=STORE_FILE):
+    """
+    Process events with checkpointing and parallel execution, reusing cached descriptions.
+
+    Each description fetched is journaled and upserted into the event store at
+    store_file (none if empty) as it arrives; its spans are reparsed when the
+    availability stage syncs the store.
+
+    Events are fetched in prioritize_events order, so those likely to book the
+    displayed court in the displayed window come first. Events not fetched in
+    time under a deadline, or whose fetch failed, keep their record from the
+    previous completed journal, so the result stays a consistent mix of old and
+    new descriptions, and are recorded in PENDING_FILE to be fetched first by
+    the next run.
+    """
     if not event_links:
         return []
     
     # Create checkpoint directory
     os.makedirs(checkpoint_dir, exist_ok=True)
-    
-    # Split events into batches for each worker
-    batches = split_into_batches(event_links, num_workers)
-    
-    # Prepare batch arguments with checkpoint files
-    batch_args = []
-    for i, batch in enumerate(batches):
-        checkpoint_file = os.path.join(checkpoint_dir, f"batch_{i}_checkpoint.json")
-        batch_args.append((i, batch, checkpoint_file))
-    
-    # Determine if any checkpoints exist and can be loaded
-    checkpoint_exists = False
-    for i in range(len(batches)):
-        checkpoint_file = os.path.join(checkpoint_dir, f"batch_{i}_checkpoint.json")
-        if os.path.exists(checkpoint_file):
-            checkpoint_exists = True
-            break
-        
-    # Process batches in parallel
-    print(f"Processing {len(event_links)} events in {len(batches)} batches with {num_workers} workers")
-    
+
+    journal_filename = os.path.join(checkpoint_dir, JOURNAL_FILE)
+    previous = read_journal(journal_filename) if os.path.exists(journal_filename) else {}
+
+    journal = CheckpointJournal(checkpoint_dir)
+    resumed = {event["event_id"]: journal.completed(event) for event in event_links}
+    pending = [event for event in event_links if resumed[event["event_id"]] is None]
+    if len(pending) < len(event_links):
+        print(f"Resuming interrupted run: {len(event_links) - len(pending)} events already journaled")
+
+    pending = prioritize_events(pending, previous, cache, load_pending(checkpoint_dir))
+    if deadline is not None:
+        print(f"Fetching within {deadline.remaining():.0f} seconds, most relevant events first")
+
+    if cache is not None:
+        cached = sum(1 for event in pending if get_cached_description(cache, event) is not None)
+        print(f"{cached} of {len(pending)} descriptions will be served from cache")
+
+    with EventStore(store_file) if store_file else contextlib.nullcontext() as store:
+        def on_result(event_info):
+            journal.append(event_info)
+            if store is not None and is_fetched_description(event_info.get("description")):
+                store.upsert(event_info)
+
+        if fetcher == "async":
+            if max_concurrency is None:
+                print(f"Processing {len(pending)} events asynchronously with up to {concurrency} requests in flight")
+            else:
+                print(f"Processing {len(pending)} events asynchronously, starting at {concurrency} requests in "
+                      f"flight and adapting up to {max_concurrency}")
+            fetched = asyncio.run(fetch_descriptions_async(pending, cache, concurrency, rate, on_result=on_result,
+                                                           max_concurrency=max_concurrency, deadline=deadline))
+        else:
+            print(f"Processing {len(pending)} events from a shared queue with {num_workers} workers")
+            fetched = process_event_queue(pending, num_workers, cache, on_result=on_result, deadline=deadline)
+        if store is not None:
+            store.commit()
+
+    fetched = {event["event_id"]: event for event in fetched}
     all_results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
-        # Submit all batches
-        future_to_batch = {executor.submit(process_event_batch, arg): arg for arg in batch_args}
-        
-        # Process results as they complete
-        for future in concurrent.futures.as_completed(future_to_batch):
-            batch_id = future_to_batch[future][0]
-            try:
-                batch_results = future.result()
-                all_results.extend(batch_results)
-                print(f"Completed batch {batch_id} with {len(batch_results)} events")
-            except Exception as exc:
-                print(f"Batch {batch_id} generated an exception: {exc}")
+    unfinished = []
+    carried = 0
+    for event in event_links:
+        record = resumed[event["event_id"]] or fetched.get(event["event_id"])
+        if record is None or not is_fetched_description(record.get("description")):
+            # Cut off by the deadline, or failed after retries: publish the last good description instead
+            unfinished.append(event["event_id"])
+            known = previous.get(event["event_id"])
+            if known is not None and is_fetched_description(known.get("description")):
+                record = known
+                carried += 1
+            elif record is None:
+                continue
+        all_results.append(record)
+    journal.commit(all_results, rewrite=bool(carried))
+    save_pending(unfinished, checkpoint_dir)
+    if unfinished:
+        metrics.increment("descriptions_deferred_total", len(unfinished))
+        print(f"{len(unfinished)} events unfinished or failed, left for the next run; "
+              f"{carried} of them kept from the previous journal")
     
     return all_results
 
+def month_view_url(url, month_start):
+    """URL of the calendar's month view for the month containing month_start."""
+    separator = "&" if urlparse(url).query else "?"
+    return f"{url}{separator}{urlencode({MONTH_VIEW_PARAMETER: f'view=month&date={month_start:%Y%m01}'})}"
+
+def upcoming_months(count, today=None):
+    """First day of the current month and each of the following count - 1 months."""
+    today = today or date.today()
+    months = []
+    year, month = today.year, today.month
+    for _ in range(count):
+        months.append(date(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+def extract_events(url=CALENDAR_URL, extractor="http", listing_html=None, session=None, months=1, pool=None,
+                   browsers=2, deadline=None):
+    """
+    Extract event links from one or more month views, falling back from HTTP to Selenium.
+
+    Month views are read concurrently, one per browser in the pool.
+
+    Args:
+        url (str): Calendar URL
+        extractor (str): "http" or "selenium"
+        listing_html (str): Optional saved month-view HTML file to parse instead of requesting the calendar
+        session (requests.Session): Optional session to reuse for the HTTP extractor
+        months (int): Number of month views to read, starting with the current month
+        pool (BrowserPool): Optional pool of warm browsers to reuse; left open for the caller
+        browsers (int): Size of the temporary pool started when no pool is given
+        deadline (Deadline): Optional budget the HTTP listing requests are bounded by
+            (see extract_event_urls_http); the Selenium fallback is skipped once it has expired
+
+    Returns:
+        list: Event dictionaries with title, url, event_id and listed_month (first day of
+        the month view the event was found in), without duplicates. Events read over HTTP
+        also carry listed_date and listed_until, the first and last day cells they are
+        listed in
+    """
+    if listing_html:
+        return extract_month(url, extractor, listing_html, session, pool, deadline)
+
+    session = session or create_session_with_retries()
+    month_starts = upcoming_months(max(months, 1))
+    month_urls = [url if number == 0 else month_view_url(url, month_start)
+                  for number, month_start in enumerate(month_starts)]
+
+    with contextlib.ExitStack() as stack:
+        if pool is None:
+            pool = stack.enter_context(BrowserPool(browsers))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(pool.size, len(month_urls))) as executor:
+            months_links = list(executor.map(
+                lambda month: extract_month(month[0], extractor, session=session, pool=pool, deadline=deadline,
+                                            month_start=month[1]),
+                zip(month_urls, month_starts)))
+
+    # Events spanning several days are listed on each of them, and in both months at a month boundary;
+    # the first listing is kept, with the last listed day added as a date hint
+    event_links = {}
+    for month_start, links in zip(month_starts, months_links):
+        if len(month_starts) > 1:
+            print(f"{month_start:%B %Y}: {len(links)} events")
+        for event in links:
+            event["listed_month"] = month_start.isoformat()
+            kept = event_links.setdefault(event["event_id"], event)
+            if "listed_date" in event:
+                kept["listed_until"] = max(kept.get("listed_until", ""), event["listed_date"])
+    return list(event_links.values())
+
+def extract_month(url=CALENDAR_URL, extractor="http", listing_html=None, session=None, pool=None, deadline=None,
+                  month_start=None):
+    """
+    Extract event links from a single month view, falling back from HTTP to Selenium.
+
+    Returns:
+        list: Event dictionaries with title, url and event_id
+    """
+    event_links = []
+    if extractor == "http" or listing_html:
+        event_links = extract_event_urls_http(url, session or create_session_with_retries(), listing_html, deadline,
+                                              month_start)
+    if deadline is not None and deadline.expired():
+        return event_links
+    if not event_links and not listing_html:
+        if extractor == "http":
+            print("HTTP extraction found no events - falling back to Selenium")
+        if pool is None:
+            return extract_event_urls(url)
+        try:
+            with pool.driver() as driver:
+                event_links = extract_event_urls(url, driver)
+        except WebDriverException as e:
+            print(f"Browser failed reading {url}: {str(e)}")
+    return event_links
+
 def save_to_csv(event_links, filename="event_links.csv"):
     """Save the extracted event links to a CSV file."""
     if not event_links:
@@ -270,7 +1435,7 @@ def save_to_csv(event_links, filename="event_links.csv"):
     
     with open(filename, 'w', newline='', encoding='utf-8') as file:
         fieldnames = ["title", "url", "event_id", "description"]
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction="ignore")
         
         writer.writeheader()
         for link in event_links:
@@ -278,35 +1443,115 @@ def save_to_csv(event_links, filename="event_links.csv"):
     
     print(f"Saved {len(event_links)} event links to {filename}")
 
-def main():
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fetch events and descriptions from the 25Live calendar.")
+    add_fetch_args(parser)
+    add_budget_arg(parser)
+    add_metrics_args(parser)
+    return parser.parse_args()
+
+def add_fetch_args(parser):
+    """Add the listing and description-fetching options shared by the pipeline scripts."""
+    parser.add_argument("--extractor", choices=["http", "selenium"], default="http",
+                        help="How to read the month view; http falls back to selenium if it finds no events")
+    parser.add_argument("--listing-html", metavar="PATH",
+                        help="Parse a saved month-view HTML file instead of requesting the calendar")
+    parser.add_argument("--months", type=int, default=1,
+                        help="Number of month views to crawl, starting with the current month")
+    parser.add_argument("--browsers", type=int, default=2,
+                        help="Headless browsers crawling month views concurrently when Selenium is used")
+    parser.add_argument("--fetcher", choices=["async", "threads"], default="async",
+                        help="Fetch descriptions with one asyncio connection pool or with a shared queue of threads")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Number of worker threads pulling from the description queue with the threads fetcher")
+    parser.add_argument("--concurrency", type=int, default=16,
+                        help="Description requests in flight the async fetcher starts with")
+    parser.add_argument("--max-concurrency", type=int, default=64,
+                        help="Limit the async fetcher may ramp up to while latency stays low "
+                             "(equal to --concurrency for a limit that only backs off)")
+    parser.add_argument("--rate", type=float, default=20.0,
+                        help="Maximum description requests started per second with the async fetcher")
+    parser.add_argument("--description-ttl", type=int, default=DESCRIPTION_TTL, metavar="SECONDS",
+                        help="Seconds a cached description is reused before being fetched again (0 disables the cache)")
+    parser.add_argument("--checkpoint-dir", default="checkpoints",
+                        help="Directory holding the checkpoint journal and the events left pending")
+    parser.add_argument("--store-file", default=STORE_FILE, metavar="PATH",
+                        help="SQLite event store that descriptions are upserted into and each run is diffed "
+                             "against ('' disables)")
+
+def add_budget_arg(parser, reserve=0):
+    """
+    Add the --budget option shared by the pipeline scripts.
+
+    Args:
+        reserve: Seconds of the budget the script keeps for work after fetching;
+            budgets that leave no time to fetch are rejected
+    """
+    def budget(value):
+        seconds = float(value)
+        if seconds <= reserve:
+            raise argparse.ArgumentTypeError(f"must be more than {reserve} seconds"
+                                             + (", which are kept for rendering and publishing" if reserve else ""))
+        return seconds
+
+    parser.add_argument("--budget", type=budget, metavar="SECONDS",
+                        help="Finish within this many seconds: fetch descriptions for the next "
+                             f"{PRIORITY_DAYS} days first and leave the rest for the next run")
+
+def add_metrics_args(parser):
+    """Add the --metrics-file and --prometheus-file options shared by the pipeline scripts."""
+    parser.add_argument("--metrics-file", default=metrics.METRICS_FILE, metavar="PATH",
+                        help="Append per-run timer and counter summaries to this JSON-lines file ('' disables)")
+    parser.add_argument("--prometheus-file", metavar="PATH",
+                        help="Also write the metrics in Prometheus text format, e.g. for node_exporter's textfile collector")
+
+def main(args):
+    deadline = Deadline(args.budget) if args.budget is not None else None
+
     # Extract new event links
-    url = "https://25livepub.collegenet.com/calendars/25live-woodpec-cal"
-    event_links = extract_event_urls(url)
+    with metrics.timer("stage_seconds", stage="extract"):
+        event_links = extract_events(CALENDAR_URL, args.extractor, args.listing_html, months=args.months,
+                                     browsers=args.browsers, deadline=deadline)
     
+    if not event_links:
+        print("No event links were extracted.")
+        return
+
+    # Only new or stale descriptions are requested from the calendar
+    cache = load_description_cache(ttl=args.description_ttl) if args.description_ttl > 0 else None
+
+    if listing_unchanged(event_links, cache, args.checkpoint_dir):
+        print(f"Calendar listing and descriptions unchanged for {len(event_links)} events - nothing to fetch")
+        return
+
     # Save extracted links
-    if event_links:
-        save_to_csv(event_links, "event_links_no_descriptions.csv")
+    save_to_csv(event_links, "event_links_no_descriptions.csv")
     
-    if event_links:
-        print(f"\nProcessing {len(event_links)} events")
-        
-        # Determine optimal number of workers
-        num_workers = 4  # Use 4 cores as requested
-        
-        # Process event descriptions with checkpointing
-        updated_links = process_with_checkpoints(event_links, num_workers)
-        
-        # Save completed results
-        save_to_csv(updated_links)
-    else:
-        print("No event links were extracted.")
+    print(f"\nProcessing {len(event_links)} events")
+    
+    # Process event descriptions with checkpointing
+    with metrics.timer("stage_seconds", stage="describe"):
+        updated_links = process_with_checkpoints(event_links, args.workers, args.checkpoint_dir, cache=cache,
+                                                 fetcher=args.fetcher, concurrency=args.concurrency, rate=args.rate,
+                                                 max_concurrency=args.max_concurrency,
+                                                 deadline=deadline, store_file=args.store_file)
+    
+    # Save completed results
+    save_to_csv(updated_links)
+    if cache is not None:
+        save_description_cache(cache)
 
 if __name__ == "__main__":
+    args = parse_args()
+
     # Record start time
     start_time = time.time()
     
-    main()
-    
-    # Print execution time
-    elapsed_time = time.time() - start_time
-    print(f"\nScript completed in {elapsed_time:.2f} seconds ({elapsed_time/60:.2f} minutes)")
+    try:
+        main(args)
+    finally:
+        # Print execution time
+        elapsed_time = time.time() - start_time
+        metrics.observe("run_seconds", elapsed_time)
+        print(f"\nScript completed in {elapsed_time:.2f} seconds ({elapsed_time/60:.2f} minutes)")
+        metrics.write(args.metrics_file, args.prometheus_file, run="fetch_data")
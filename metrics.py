@@ -0,0 +1,167 @@
+"""
+In-process timers, counters and histograms for the pipeline stages.
+
+Every script records into the module-level registry with
+
+    with timer("render_seconds"):
+        ...
+    increment("description_retries_total", fetcher="async")
+    set_gauge("description_concurrency_limit", 12)
+
+and writes it out at exit: a JSON-lines summary per run (count, sum, min,
+max, p50/p95 and buckets for every series) appended to METRICS_FILE, and
+optionally a Prometheus text-format file for node_exporter's textfile
+collector.
+"""
+import os
+import json
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+METRICS_FILE = "metrics/metrics.jsonl"
+
+# Histogram bucket upper bounds in seconds, from a single request up to a whole run
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# Observations kept per series for quantiles; beyond this only the buckets are exact
+MAX_SAMPLES = 10000
+
+_lock = threading.Lock()
+_counters = {}
+_gauges = {}
+_histograms = {}
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+def increment(name, amount=1, **labels):
+    """Add to a counter."""
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+def set_gauge(name, value, **labels):
+    """Record the current value of something that goes up and down, e.g. a concurrency limit."""
+    key = _key(name, labels)
+    with _lock:
+        _gauges[key] = value
+
+def observe(name, value, **labels):
+    """Record one observation, usually a duration in seconds, in a histogram."""
+    key = _key(name, labels)
+    with _lock:
+        histogram = _histograms.get(key)
+        if histogram is None:
+            histogram = _histograms[key] = {"count": 0, "sum": 0.0, "min": value, "max": value,
+                                            "buckets": [0] * (len(BUCKETS) + 1), "samples": []}
+        histogram["count"] += 1
+        histogram["sum"] += value
+        histogram["min"] = min(histogram["min"], value)
+        histogram["max"] = max(histogram["max"], value)
+        histogram["buckets"][bisect_left(BUCKETS, value)] += 1
+        if len(histogram["samples"]) < MAX_SAMPLES:
+            histogram["samples"].append(value)
+
+@contextmanager
+def timer(name, **labels):
+    """Observe the wall-clock duration of the with-block, including when it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+def reset():
+    """Forget everything recorded so far, e.g. between daemon ticks."""
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _histograms.clear()
+
+def _quantile(samples, q):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def snapshot():
+    """
+    Summarize every series.
+
+    Returns:
+        List of dictionaries with name, type, labels and either value or histogram statistics
+    """
+    with _lock:
+        series = [{"name": name, "type": "counter", "labels": dict(labels), "value": value}
+                  for (name, labels), value in sorted(_counters.items())]
+        series.extend({"name": name, "type": "gauge", "labels": dict(labels), "value": value}
+                      for (name, labels), value in sorted(_gauges.items()))
+        for (name, labels), histogram in sorted(_histograms.items()):
+            series.append({
+                "name": name,
+                "type": "histogram",
+                "labels": dict(labels),
+                "count": histogram["count"],
+                "sum": round(histogram["sum"], 6),
+                "min": round(histogram["min"], 6),
+                "max": round(histogram["max"], 6),
+                "p50": round(_quantile(histogram["samples"], 0.5), 6),
+                "p95": round(_quantile(histogram["samples"], 0.95), 6),
+                "buckets": dict(zip([str(bound) for bound in BUCKETS] + ["+Inf"], histogram["buckets"]))
+            })
+    return series
+
+def write_jsonl(filename=METRICS_FILE, run=None):
+    """Append one JSON line per series, all tagged with the same run name and timestamp."""
+    series = snapshot()
+    if not series:
+        return
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    recorded_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    with open(filename, 'a', encoding='utf-8') as f:
+        for entry in series:
+            f.write(json.dumps({"run": run, "recorded_at": recorded_at, **entry}) + "\n")
+    print(f"Recorded {len(series)} metric series to {filename}")
+
+def _format_labels(labels, extra=None):
+    pairs = list(labels.items()) + (list(extra.items()) if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{str(value)}"' for key, value in pairs) + "}"
+
+def write_prometheus(filename, prefix="court_availability_"):
+    """Write every series in Prometheus text exposition format, replacing the file atomically."""
+    lines = []
+    typed = set()
+    for entry in snapshot():
+        name = prefix + entry["name"]
+        if name not in typed:
+            lines.append(f"# TYPE {name} {entry['type']}")
+            typed.add(name)
+        labels = entry["labels"]
+        if entry["type"] in ("counter", "gauge"):
+            lines.append(f"{name}{_format_labels(labels)} {entry['value']}")
+            continue
+        cumulative = 0
+        for bound, count in entry["buckets"].items():
+            cumulative += count
+            lines.append(f"{name}_bucket{_format_labels(labels, {'le': bound})} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {entry['sum']}")
+        lines.append(f"{name}_count{_format_labels(labels)} {entry['count']}")
+
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    temp_filename = f"{filename}.tmp"
+    with open(temp_filename, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(temp_filename, filename)
+    print(f"Wrote Prometheus metrics to {filename}")
+
+def write(metrics_file=METRICS_FILE, prometheus_file=None, run=None):
+    """Write the JSON-lines summary and, if a path is given, the Prometheus file."""
+    if metrics_file:
+        write_jsonl(metrics_file, run)
+    if prometheus_file:
+        write_prometheus(prometheus_file)
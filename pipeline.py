@@ -0,0 +1,210 @@
+"""
+Single-process pipeline: extract -> describe -> diff -> availability -> render.
+
+Stages hand their results to the next one in memory - descriptions are
+streamed through the parser by generators - instead of round-tripping
+through CSV and JSON files between separate scripts. Those files are
+optional sinks. The checkpoint journal is always written, since it is what
+lets an interrupted run resume and what daemon.py reads.
+
+The describe stage upserts each fetched description into the SQLite event
+store (see event_store.py), and syncing the listing into it diffs against
+the previous run, so only added, removed and changed events are parsed and
+only the availability entries they touch are recomputed, from indexed range
+queries on the store.
+
+With --budget the listing and describe stages stop PUBLISH_RESERVE seconds
+before the budget runs out (so the budget must be longer than that), after
+fetching the events the page shows first. Events it did not reach keep
+their previous description and are fetched first next run, so every run
+publishes a consistent page on time.
+
+Usage:
+    python pipeline.py [--csv] [--budget SECONDS] [--no-availability-file] [--no-render] [--publish]
+"""
+import os
+import time
+import argparse
+from datetime import datetime, timedelta
+import metrics
+from fetch_data import (CALENDAR_URL, JOURNAL_FILE, PUBLISH_RESERVE, Deadline, add_budget_arg, add_fetch_args,
+                        add_metrics_args, create_session_with_retries, extract_events, is_fetched_description,
+                        listing_unchanged, load_description_cache, process_with_checkpoints, save_description_cache,
+                        save_to_csv)
+from event_parser import iter_journal, parse_description
+from availability import (HORIZON_DAYS, build_event_index, load_availability, patch_availability_data, stale_keys,
+                          timezone, write_availability)
+from changeset import summarize
+from event_store import STORE_FILE, EventStore
+from court_availability import DATA_FILE, DISPLAY_DAYS, commit_and_push_changes, generate_html
+
+def descriptions(events):
+    """Yield the description of every event whose page was fetched successfully."""
+    for event in events:
+        description = event.get("description")
+        if is_fetched_description(description) and description.strip():
+            yield description
+
+def parse_events(descriptions):
+    """Yield per-day parsed events for a stream of descriptions."""
+    for description in descriptions:
+        events = parse_description(description)
+        if events:
+            metrics.increment("descriptions_parsed_total")
+            yield from events
+        else:
+            metrics.increment("description_parse_failures_total")
+            print(f"Failed to parse event: {description}")
+
+def index_events(parsed_events):
+    """
+    Consume a stream of parsed events in one pass.
+
+    Returns:
+        Tuple of (sorted list of dates that have events, index from availability.build_event_index)
+    """
+    dates = set()
+
+    def track_dates():
+        for event in parsed_events:
+            dates.add(event["date"])
+            yield event
+
+    event_index = build_event_index(track_dates())
+    return sorted(dates), event_index
+
+def update_availability(events, availability_file=DATA_FILE, store_file=STORE_FILE, horizon_days=HORIZON_DAYS):
+    """
+    Sync events into the event store and patch the previous run's availability data.
+
+    Everything is rebuilt when there is no previous run to patch: no availability
+    file, or one that was not written from the store's current contents.
+
+    Args:
+        events: Iterable of described event dictionaries
+        availability_file: Availability JSON to patch and write; None to build in memory only
+        store_file: SQLite event store holding the previous run's events
+        horizon_days: Days from today to publish, or None for every date
+
+    Returns:
+        Tuple of (availability data, changeset from EventStore.sync)
+    """
+    with EventStore(store_file) as store:
+        # Diffing the events and parsing the added and changed ones
+        with metrics.timer("stage_seconds", stage="parse"):
+            changeset = store.sync(events)
+        print(f"Changes since the previous run: {summarize(changeset)}")
+
+        with metrics.timer("stage_seconds", stage="availability"):
+            previous = load_availability(availability_file) if availability_file else None
+            if previous is None or store.get_meta("availability_hash") != previous.get("content_hash"):
+                print("Availability data does not match the event store - rebuilding all availability")
+                previous = {}
+
+            start = datetime.now(timezone).date()
+            dates = store.dates(start, start + timedelta(days=horizon_days)) if horizon_days is not None else store.dates()
+            courts = store.courts()
+            keys = stale_keys(previous, dates, courts, changeset["affected"])
+            print(f"Recomputing {len(keys)} of {len(dates) * len(courts)} (date, court) availability entries")
+            data = patch_availability_data(previous, dates, courts, keys, store.event_index(keys))
+
+            if availability_file:
+                data = write_availability(data, availability_file) or data
+                store.set_meta("availability_hash", data["content_hash"])
+        # Committed last, so a run that fails before writing the data is diffed again next time
+        store.commit()
+    return data, changeset
+
+def describe_events(event_links, args, cache=None, deadline=None):
+    """
+    Fetch descriptions for the listing, or stream the last journal when nothing changed.
+
+    Args:
+        deadline: Optional fetch_data.Deadline for the describe stage
+
+    Returns:
+        Iterable of event dictionaries with descriptions
+    """
+    if listing_unchanged(event_links, cache, args.checkpoint_dir):
+        print(f"Calendar listing and descriptions unchanged for {len(event_links)} events - reusing the journal")
+        return iter_journal(os.path.join(args.checkpoint_dir, JOURNAL_FILE))
+
+    if args.csv:
+        save_to_csv(event_links, "event_links_no_descriptions.csv")
+    print(f"\nProcessing {len(event_links)} events")
+    updated_links = process_with_checkpoints(event_links, args.workers, args.checkpoint_dir, cache=cache,
+                                             fetcher=args.fetcher, concurrency=args.concurrency, rate=args.rate,
+                                             max_concurrency=args.max_concurrency, deadline=deadline,
+                                             store_file=args.store_file)
+    if args.csv:
+        save_to_csv(updated_links)
+    if cache is not None:
+        save_description_cache(cache)
+    return updated_links
+
+def run_pipeline(args):
+    """
+    Run every stage once.
+
+    Returns:
+        bool: True if index.html was (re)written
+    """
+    deadline = Deadline(args.budget).reserve(PUBLISH_RESERVE) if args.budget is not None else None
+    with metrics.timer("stage_seconds", stage="extract"):
+        event_links = extract_events(CALENDAR_URL, args.extractor, args.listing_html, create_session_with_retries(),
+                                     months=args.months, browsers=args.browsers, deadline=deadline)
+    if not event_links:
+        print("No event links were extracted.")
+        return False
+
+    cache = load_description_cache(ttl=args.description_ttl) if args.description_ttl > 0 else None
+    with metrics.timer("stage_seconds", stage="describe"):
+        events = describe_events(event_links, args, cache, deadline)
+
+    # Only added and changed events are parsed, inside the diff
+    # Times its parse and availability stages itself
+    data, changeset = update_availability(events, args.availability_file, args.store_file, args.horizon_days)
+    for kind in ("added", "removed", "changed"):
+        metrics.increment("events_changed_total", len(changeset[kind]), kind=kind)
+
+    if not args.render:
+        return False
+    with metrics.timer("stage_seconds", stage="render"):
+        rendered = generate_html(data, args.display_days)
+    if rendered and args.publish:
+        commit_and_push_changes(summarize(changeset))
+    return rendered
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fetch, parse and render court availability in one process.")
+    add_fetch_args(parser)
+    parser.add_argument("--availability-file", default=DATA_FILE, metavar="PATH",
+                        help="Where to write the availability JSON")
+    parser.add_argument("--no-availability-file", dest="availability_file", action="store_const", const=None,
+                        help="Do not write the availability JSON")
+    parser.add_argument("--no-render", dest="render", action="store_false", help="Do not regenerate index.html")
+    add_output_args(parser)
+    add_budget_arg(parser, reserve=PUBLISH_RESERVE)
+    add_metrics_args(parser)
+    return parser.parse_args()
+
+def add_output_args(parser):
+    """Add the CSV, availability and publishing options shared with daemon.py."""
+    parser.add_argument("--csv", action="store_true",
+                        help="Also write event_links_no_descriptions.csv and event_links.csv")
+    parser.add_argument("--horizon-days", type=int, default=HORIZON_DAYS,
+                        help="Days from today to compute and publish availability for")
+    parser.add_argument("--display-days", type=int, default=DISPLAY_DAYS, help="Days shown on index.html")
+    parser.add_argument("--publish", action="store_true",
+                        help="Commit and push index.html and data/ when the page was re-rendered")
+
+if __name__ == "__main__":
+    args = parse_args()
+    start_time = time.time()
+    try:
+        run_pipeline(args)
+    finally:
+        elapsed_time = time.time() - start_time
+        metrics.observe("run_seconds", elapsed_time)
+        print(f"\nPipeline completed in {elapsed_time:.2f} seconds ({elapsed_time/60:.2f} minutes)")
+        metrics.write(args.metrics_file, args.prometheus_file, run="pipeline")
@@ -0,0 +1,170 @@
+"""
+Optional long-running availability API.
+
+Answers
+
+    GET /availability?court=3&from=2025-12-01&to=2025-12-07
+
+for any court and date range without a regeneration cycle, from indexed
+range queries on the SQLite event store the pipeline keeps up to date (see
+event_store.py): only the requested court's spans on the requested dates are
+read. Rendered responses are kept in an LRU cache keyed by the store's
+version, which changes whenever a run commits to the store, and carry an
+ETag (If-None-Match gets a 304).
+
+Usage:
+    python server.py [--host 127.0.0.1] [--port 5000] [--store-file checkpoints/events.sqlite]
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import argparse
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
+from flask import Flask, Response, jsonify, request
+from availability import DISPLAY_COURT, DayAvailability, index_spans, timezone
+from event_store import STORE_FILE, EventStore
+
+# Longest date range a single request may ask for
+MAX_RANGE_DAYS = 120
+
+# Seconds between checks of the store's modification time
+RELOAD_CHECK_INTERVAL = 2.0
+
+app = Flask(__name__)
+
+class AvailabilityState:
+    """Read-only connection to the event store, versioned by the store file's modification time."""
+
+    def __init__(self, store_file):
+        self.store_file = store_file
+        self.lock = threading.Lock()
+        self.store = None
+        self.mtime = None
+        self.checked_at = 0.0
+        self.version = None
+        self.courts = []
+
+    def refresh(self):
+        """Pick up a new version if the store changed since the last check. Cheap when it did not."""
+        now = time.monotonic()
+        if now - self.checked_at < RELOAD_CHECK_INTERVAL and self.version is not None:
+            return
+        with self.lock:
+            self.checked_at = now
+            try:
+                mtime = os.path.getmtime(self.store_file)
+            except OSError:
+                return
+            if mtime == self.mtime:
+                return
+
+            # Reopened on every change: the pipeline may have rebuilt it for a new schema
+            try:
+                store = EventStore(self.store_file, readonly=True)
+                courts = store.courts()
+            except (sqlite3.Error, ValueError) as e:
+                print(f"Cannot read {self.store_file}: {str(e)}")
+                return
+            if self.store is not None:
+                self.store.close()
+            self.store = store
+            self.courts = courts
+            self.mtime = mtime
+            self.version = hashlib.sha256(f"{self.store_file}:{mtime}".encode()).hexdigest()[:16]
+            render_availability.cache_clear()
+            print(f"Serving {self.store_file} as of {datetime.fromtimestamp(mtime):%Y-%m-%d %H:%M:%S}")
+
+    def availability(self, court, start, end):
+        """DayAvailability for one court over [start, end], read from the store."""
+        with self.lock:
+            spans = list(self.store.spans(start, end, courts={court}))
+            dates = self.store.dates(start, end + timedelta(days=1))
+        return DayAvailability(index_spans(spans), dates)
+
+state = AvailabilityState(STORE_FILE)
+
+@lru_cache(maxsize=512)
+def render_availability(version, court, start, end):
+    """
+    Render one availability response.
+
+    The data version is part of the cache key, so responses for an updated
+    store are never served even before cache_clear runs.
+
+    Returns:
+        Tuple of (JSON body bytes, unquoted ETag)
+    """
+    availability = state.availability(court, start, end)
+    days = {}
+    day = start
+    while day <= end:
+        if day in availability.dates:
+            days[day.isoformat()] = availability.labels(day, court)
+        else:
+            # Outside the crawled calendar - unknown rather than free
+            days[day.isoformat()] = None
+        day += timedelta(days=1)
+
+    body = json.dumps({
+        "court": court,
+        "from": start.isoformat(),
+        "to": end.isoformat(),
+        "version": version,
+        "availability": days
+    }).encode()
+    return body, hashlib.sha256(body).hexdigest()[:16]
+
+def parse_date_arg(name, default):
+    value = request.args.get(name)
+    if not value:
+        return default
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+@app.route("/availability")
+def availability():
+    state.refresh()
+    if state.version is None:
+        return jsonify(error=f"No event store at {state.store_file}"), 503
+
+    today = datetime.now(timezone).date()
+    try:
+        court = int(request.args.get("court", DISPLAY_COURT))
+        start = parse_date_arg("from", today)
+        end = parse_date_arg("to", start + timedelta(days=6))
+    except ValueError:
+        return jsonify(error="court must be an integer and from/to dates must be YYYY-MM-DD"), 400
+
+    if court not in state.courts:
+        return jsonify(error=f"Unknown court {court}", courts=state.courts), 404
+    if end < start or (end - start).days >= MAX_RANGE_DAYS:
+        return jsonify(error=f"to must be on or after from, spanning at most {MAX_RANGE_DAYS} days"), 400
+
+    body, etag = render_availability(state.version, court, start, end)
+    response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    # Answers 304 Not Modified when If-None-Match carries this ETag
+    return response.make_conditional(request)
+
+@app.route("/courts")
+def courts():
+    state.refresh()
+    return jsonify(courts=state.courts, version=state.version)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve court availability from the event store.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--store-file", default=STORE_FILE, help="SQLite event store kept up to date by pipeline.py")
+    args = parser.parse_args()
+
+    state.store_file = args.store_file
+    state.refresh()
+    app.run(host=args.host, port=args.port, threaded=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+// Keeps an open page current without reloading it.
+//
+// data/current.json is a tiny pointer ({version, last_updated, data}) that is
+// polled with conditional requests, so an unchanged poll is a 304. Only when
+// the version changes is the content-hashed days file fetched, and only the
+// day blocks whose signature changed are rebuilt.
+(function () {
+    "use strict";
+
+    var POINTER_URL = "data/current.json";
+    var POLL_INTERVAL = 5 * 60 * 1000;
+
+    var versionMeta = document.querySelector('meta[name="availability-version"]');
+    var currentVersion = versionMeta ? versionMeta.content : null;
+    var polling = false;
+
+    function element(tag, className, text) {
+        var node = document.createElement(tag);
+        if (className) {
+            node.className = className;
+        }
+        if (text !== undefined) {
+            node.textContent = text;
+        }
+        return node;
+    }
+
+    function fillDay(block, day) {
+        var slots = element("div", "slots");
+        if (day.no_data) {
+            slots.appendChild(element("p", "no-data", "No data available"));
+        } else if (day.slots.length) {
+            day.slots.forEach(function (slot) {
+                slots.appendChild(element("div", "slot", slot));
+            });
+        } else {
+            slots.appendChild(element("p", "no-slots", "No available slots"));
+        }
+
+        block.textContent = "";
+        block.appendChild(element("h2", null, day.display));
+        block.appendChild(slots);
+        block.setAttribute("data-date", day.date_str);
+        block.setAttribute("data-signature", day.signature);
+    }
+
+    function patch(data) {
+        var container = document.getElementById("days");
+        var existing = {};
+        Array.prototype.forEach.call(container.querySelectorAll(".day-container"), function (block) {
+            existing[block.getAttribute("data-date")] = block;
+        });
+
+        data.dates.forEach(function (day, position) {
+            var block = existing[day.date_str];
+            delete existing[day.date_str];
+            if (!block) {
+                block = element("div", "day-container");
+                fillDay(block, day);
+            } else if (block.getAttribute("data-signature") !== day.signature) {
+                fillDay(block, day);
+            }
+            if (container.children[position] !== block) {
+                container.insertBefore(block, container.children[position] || null);
+            }
+        });
+
+        // Days that scrolled out of the displayed window
+        Object.keys(existing).forEach(function (date) {
+            container.removeChild(existing[date]);
+        });
+
+        var updated = document.querySelector(".updated");
+        if (updated) {
+            updated.textContent = "Last updated: " + data.last_updated;
+        }
+    }
+
+    // Versions look like "<data hash>:<day>+<days shown>:<css hash>:<js hash>"
+    function assetsChanged(version) {
+        if (!currentVersion) {
+            return false;
+        }
+        return version.split(":").slice(2).join(":") !== currentVersion.split(":").slice(2).join(":");
+    }
+
+    function poll() {
+        if (polling || !window.fetch) {
+            return;
+        }
+        polling = true;
+        // "no-cache" revalidates with If-None-Match, so an unchanged pointer costs a 304
+        fetch(POINTER_URL, {cache: "no-cache"})
+            .then(function (response) {
+                return response.ok ? response.json() : null;
+            })
+            .then(function (pointer) {
+                if (!pointer || pointer.version === currentVersion) {
+                    return null;
+                }
+                if (assetsChanged(pointer.version)) {
+                    // New stylesheet or script - patching is not enough
+                    window.location.reload();
+                    return null;
+                }
+                // The days file is named after its content hash, so the normal HTTP cache is safe
+                return fetch(pointer.data).then(function (response) {
+                    return response.json();
+                }).then(function (data) {
+                    patch(data);
+                    currentVersion = data.version;
+                });
+            })
+            .catch(function () {
+                // Keep showing the current data; the next poll will retry
+            })
+            .then(function () {
+                polling = false;
+            });
+    }
+
+    setInterval(poll, POLL_INTERVAL);
+    document.addEventListener("visibilitychange", function () {
+        if (!document.hidden) {
+            poll();
+        }
+    });
+})();
@@ -0,0 +1,43 @@
+"""process_with_checkpoints keeps the last good description when a fetch fails."""
+import functools
+import json
+import os
+
+import fetch_data
+from event_store import EventStore
+from fetch_data import PENDING_FILE, process_with_checkpoints, read_journal
+from benchmarks.fake_server import FakeCalendarServer
+
+COURT_3 = {"title": "WBB Practice", "url": "", "event_id": "1313847853",
+           "description": "Monday, December 1, 2025, 6:30 - 8:30am Woodruff PE Center Court #3"}
+COURT_4 = {"title": "CS Badminton", "url": "", "event_id": "1290869217",
+           "description": "Friday, December 5, 2025, 6:30 - 9pm Woodruff PE Center Court #4"}
+
+def listed(event):
+    return {key: event[key] for key in ("title", "url", "event_id")}
+
+def test_failed_fetch_keeps_previous_record_and_is_pending(tmp_path, monkeypatch):
+    checkpoint_dir = str(tmp_path)
+    store_file = str(tmp_path / "events.sqlite")
+    with open(os.path.join(checkpoint_dir, fetch_data.JOURNAL_FILE), 'w', encoding='utf-8') as f:
+        f.write(json.dumps(COURT_3) + "\n")
+    monkeypatch.setattr(fetch_data, "RETRY_BACKOFF_FACTOR", 0.001)
+
+    script = {COURT_3["event_id"]: [(429, {})] * (fetch_data.RETRY_TOTAL + 1)}
+    with FakeCalendarServer([COURT_3, COURT_4], script=script) as calendar:
+        monkeypatch.setattr(fetch_data, "fetch_descriptions_async",
+                            functools.partial(fetch_data.fetch_descriptions_async, url=calendar.url, http2=False))
+        results = process_with_checkpoints([listed(COURT_3), listed(COURT_4)], checkpoint_dir=checkpoint_dir,
+                                           rate=1000.0, store_file=store_file)
+
+    assert [event["description"] for event in results] == [COURT_3["description"], COURT_4["description"]]
+    journal = read_journal(os.path.join(checkpoint_dir, fetch_data.JOURNAL_FILE))
+    assert journal[COURT_3["event_id"]]["description"] == COURT_3["description"]
+    with open(os.path.join(checkpoint_dir, PENDING_FILE), encoding='utf-8') as f:
+        assert json.load(f) == [COURT_3["event_id"]]
+
+    # Only the description actually fetched is upserted, stamped with when it was fetched
+    with EventStore(store_file) as store:
+        rows = store.connection.execute("SELECT event_id, description, fetched_at FROM events").fetchall()
+    assert [row[:2] for row in rows] == [(COURT_4["event_id"], COURT_4["description"])]
+    assert rows[0][2] == results[1]["fetched_at"]
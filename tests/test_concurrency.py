@@ -0,0 +1,49 @@
+"""AdaptiveConcurrency against the local fake calendar server."""
+import asyncio
+
+import fetch_data
+from fetch_data import fetch_descriptions_async
+from benchmarks.fake_server import FakeCalendarServer
+
+EVENTS = [{"title": "WBB Practice", "url": "", "event_id": str(number),
+           "description": "Monday, December 1, 2025, 6:30 - 8:30am Woodruff PE Center Court #3"}
+          for number in range(120)]
+
+def listed(event):
+    return {key: event[key] for key in ("title", "url", "event_id")}
+
+def run_limiter(monkeypatch, server, concurrency, max_concurrency, rate, events=EVENTS[:40]):
+    """Fetch every event and return the limiter's successive limits, starting with the initial one."""
+    limits = []
+
+    class RecordingConcurrency(fetch_data.AdaptiveConcurrency):
+        def _set_limit(self, limit, reason):
+            super()._set_limit(limit, reason)
+            if self.limit != limits[-1]:
+                limits.append(self.limit)
+
+    monkeypatch.setattr(fetch_data, "AdaptiveConcurrency", RecordingConcurrency)
+    limits.append(concurrency)
+    results = asyncio.run(fetch_descriptions_async([listed(event) for event in events], concurrency=concurrency,
+                                                   rate=rate, url=server.url, http2=False,
+                                                   max_concurrency=max_concurrency))
+    assert [result["description"] for result in results] == [event["description"] for event in events]
+    return limits
+
+def test_limit_ramps_up_while_every_slot_is_busy(monkeypatch):
+    with FakeCalendarServer(EVENTS, latency=0.05) as server:
+        limits = run_limiter(monkeypatch, server, concurrency=2, max_concurrency=6, rate=1000.0)
+    assert limits == [2, 3, 4, 5, 6]
+
+def test_limit_halves_on_429(monkeypatch):
+    script = {EVENTS[0]["event_id"]: [(429, {"Retry-After": "0"})]}
+    with FakeCalendarServer(EVENTS, latency=0.05, script=script) as server:
+        limits = run_limiter(monkeypatch, server, concurrency=8, max_concurrency=16, rate=1000.0)
+    assert limits[:2] == [8, 4]
+
+def test_limit_holds_when_the_rate_limit_is_the_bottleneck(monkeypatch):
+    # At 40 requests per second and 20 ms latency about one request is in flight; even the
+    # initial burst of 40 tokens never fills 48 slots, so no window says the server could take more
+    with FakeCalendarServer(EVENTS, latency=0.02) as server:
+        limits = run_limiter(monkeypatch, server, concurrency=48, max_concurrency=64, rate=40.0, events=EVENTS)
+    assert limits == [48]
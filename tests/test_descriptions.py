@@ -0,0 +1,107 @@
+"""Retry behaviour of both description fetchers against the local fake calendar server."""
+import asyncio
+import time
+
+import fetch_data
+from fetch_data import (Deadline, create_session_with_retries, fetch_descriptions_async, get_event_description,
+                        process_event_queue)
+from benchmarks.fake_server import FakeCalendarServer
+
+EVENT = {"title": "WBB Practice", "url": "", "event_id": "1313847853",
+         "description": "Monday, December 1, 2025, 6:30 - 8:30am Woodruff PE Center Court #3"}
+
+def listed(event):
+    return {key: event[key] for key in ("title", "url", "event_id")}
+
+def fetch_async(url, events):
+    return asyncio.run(fetch_descriptions_async(events, url=url, http2=False, rate=1000.0))
+
+def test_async_fetcher_retries_503_after_retry_after():
+    with FakeCalendarServer([EVENT], script={EVENT["event_id"]: [(503, {"Retry-After": "1"})]}) as calendar:
+        results = fetch_async(calendar.url, [listed(EVENT)])
+
+    assert results[0]["description"] == EVENT["description"]
+    first, second = calendar.requests[EVENT["event_id"]]
+    assert second - first >= 1.0
+
+def test_async_fetcher_retries_429_then_succeeds():
+    with FakeCalendarServer([EVENT], script={EVENT["event_id"]: [(429, {"Retry-After": "0"})] * 2}) as calendar:
+        results = fetch_async(calendar.url, [listed(EVENT)])
+
+    assert results[0]["description"] == EVENT["description"]
+    assert len(calendar.requests[EVENT["event_id"]]) == 3
+
+def test_async_fetcher_gives_up_after_retry_total(monkeypatch):
+    monkeypatch.setattr(fetch_data, "RETRY_BACKOFF_FACTOR", 0.01)
+    script = {EVENT["event_id"]: [(503, {})] * (fetch_data.RETRY_TOTAL + 1)}
+    with FakeCalendarServer([EVENT], script=script) as calendar:
+        results = fetch_async(calendar.url, [listed(EVENT)])
+
+    assert results[0]["description"] == "Failed with status code: 503"
+    assert len(calendar.requests[EVENT["event_id"]]) == fetch_data.RETRY_TOTAL + 1
+
+def test_async_fetcher_does_not_retry_404():
+    with FakeCalendarServer([]) as calendar:
+        results = fetch_async(calendar.url, [listed(EVENT)])
+
+    assert results[0]["description"] == "Failed with status code: 404"
+    assert len(calendar.requests[EVENT["event_id"]]) == 1
+
+def test_threads_fetcher_retries_503_after_retry_after():
+    with FakeCalendarServer([EVENT], script={EVENT["event_id"]: [(503, {"Retry-After": "1"})]}) as calendar:
+        result = get_event_description(create_session_with_retries(), listed(EVENT), url=calendar.url)
+
+    assert result["description"] == EVENT["description"]
+    first, second = calendar.requests[EVENT["event_id"]]
+    assert second - first >= 1.0
+
+def test_retry_after_seconds():
+    assert fetch_data.retry_after_seconds("3") == 3
+    assert fetch_data.retry_after_seconds(None) == 0
+    assert fetch_data.retry_after_seconds("soon") == 0
+    assert fetch_data.retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+def test_threads_fetcher_stops_at_the_deadline_without_touching_the_cache():
+    events = [dict(EVENT, event_id=str(number)) for number in range(8)]
+    cache = {}
+    with FakeCalendarServer(events, latency=0.5) as calendar:
+        start = time.monotonic()
+        results = process_event_queue([listed(event) for event in events], 2, cache, calendar.url,
+                                      deadline=Deadline(0.75))
+        elapsed = time.monotonic() - start
+        cached_at_deadline = dict(cache)
+        time.sleep(0.6)
+
+    assert elapsed < 1.0
+    assert [event["event_id"] for event in results] == ["0", "1"]
+    assert set(cached_at_deadline) == {"0", "1"}
+    # Requests that finished after the deadline were dropped, not cached behind the caller's back
+    assert cache == cached_at_deadline
+
+def test_retry_delay_matches_the_session_retry_policy():
+    retry = create_session_with_retries().get_adapter("https://").max_retries
+    for attempt in range(fetch_data.RETRY_TOTAL):
+        retry = retry.increment("POST", "/", error=ConnectionError())
+        assert fetch_data.retry_delay(attempt) == retry.get_backoff_time()
+
+def test_both_fetchers_reuse_the_connection_after_the_description_tag():
+    events = [dict(EVENT, event_id=str(number)) for number in range(20)]
+    with FakeCalendarServer(events, body_kb=40) as calendar:
+        session = create_session_with_retries()
+        for event in events:
+            assert get_event_description(session, listed(event), url=calendar.url)["description"] == EVENT["description"]
+        assert calendar.connections == 1
+
+        results = asyncio.run(fetch_descriptions_async([listed(event) for event in events], concurrency=1,
+                                                       url=calendar.url, http2=False, rate=1000.0))
+        assert all(result["description"] == EVENT["description"] for result in results)
+        assert calendar.connections == 2
+
+def test_pages_longer_than_the_drain_limit_are_cut_off(monkeypatch):
+    monkeypatch.setattr(fetch_data, "DESCRIPTION_DRAIN_LIMIT", 8 * 1024)
+    events = [dict(EVENT, event_id=str(number)) for number in range(3)]
+    with FakeCalendarServer(events, body_kb=40) as calendar:
+        session = create_session_with_retries()
+        for event in events:
+            assert get_event_description(session, listed(event), url=calendar.url)["description"] == EVENT["description"]
+    assert calendar.connections == 3
@@ -0,0 +1,64 @@
+"""EventStore reparses only descriptions that changed since they were last synced."""
+import sqlite3
+from datetime import date
+
+import pytest
+
+from event_store import EventStore
+
+EVENT = {"title": "WBB Practice", "url": "", "event_id": "1313847853",
+         "description": "Monday, December 1, 2025, 6:30 - 8:30am Woodruff PE Center Court #3"}
+MOVED = dict(EVENT, description="Tuesday, December 2, 2025, 6:30 - 8:30am Woodruff PE Center Court #3",
+             fetched_at=1764547200.0)
+
+def fetched_at(store, event_id):
+    return store.connection.execute("SELECT fetched_at FROM events WHERE event_id = ?", (event_id,)).fetchone()[0]
+
+def test_sync_reparses_upserted_descriptions(tmp_path):
+    with EventStore(str(tmp_path / "events.sqlite")) as store:
+        changeset = store.sync([EVENT])
+        assert changeset["added"] == [EVENT["event_id"]]
+        assert changeset["affected"] == {(date(2025, 12, 1), 3)}
+        assert store.sync([EVENT])["affected"] == set()
+
+        # Upserted by the describe stage: the spans still reflect the old description until the next sync
+        store.upsert(MOVED)
+        assert store.dates() == [date(2025, 12, 1)]
+        changeset = store.sync([MOVED])
+        assert changeset["changed"] == [EVENT["event_id"]]
+        assert changeset["affected"] == {(date(2025, 12, 1), 3), (date(2025, 12, 2), 3)}
+        assert store.dates() == [date(2025, 12, 2)]
+        assert list(store.spans(date(2025, 12, 1), date(2025, 12, 7), courts={3})) == [
+            (date(2025, 12, 2), 3, 390, 510)]
+
+        # Records without a fetch time, e.g. from an older journal, keep the one stored
+        store.sync([EVENT])
+        assert fetched_at(store, EVENT["event_id"]) == MOVED["fetched_at"]
+
+        changeset = store.sync([])
+        assert changeset["removed"] == [EVENT["event_id"]]
+        assert store.dates() == []
+
+def test_readonly_store_reads_without_creating_or_rebuilding(tmp_path):
+    filename = str(tmp_path / "events.sqlite")
+    with pytest.raises(sqlite3.OperationalError):
+        EventStore(filename, readonly=True)
+    assert not (tmp_path / "events.sqlite").exists()
+
+    with EventStore(filename) as store:
+        store.sync([EVENT])
+        store.commit()
+
+    with EventStore(filename, readonly=True) as store:
+        assert store.dates() == [date(2025, 12, 1)]
+        with pytest.raises(sqlite3.OperationalError):
+            store.upsert(MOVED)
+
+    # A store from another schema version is left for the pipeline to rebuild
+    connection = sqlite3.connect(filename)
+    connection.execute("PRAGMA user_version = 1")
+    connection.close()
+    with pytest.raises(ValueError):
+        EventStore(filename, readonly=True)
+    with EventStore(filename) as store:
+        assert store.dates() == []
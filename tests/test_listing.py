@@ -0,0 +1,104 @@
+"""Offline checks of month-view extraction against the saved pages in tests/fixtures."""
+import os
+from datetime import date, timedelta
+
+from fetch_data import (CALENDAR_URL, PRIORITY_DAYS, Deadline, extract_event_urls_http, extract_events,
+                        find_listing_frames, parse_event_listing, prioritize_events)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+MONTH_VIEW = os.path.join(FIXTURES, "month_view.html")
+CALENDAR_PAGE = os.path.join(FIXTURES, "calendar_page.html")
+
+EXPECTED_IDS = ["1341026993", "1313847851", "1290411645", "1313847853", "1290411647", "1293151779", "1293150998"]
+
+def read(filename):
+    with open(filename, 'r', encoding='utf-8') as f:
+        return f.read()
+
+class FakeResponse:
+    def __init__(self, url, text):
+        self.url = url
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+class FakeSession:
+    """Serves saved pages by URL and records what was requested."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+        self.timeouts = []
+
+    def get(self, url, timeout=None):
+        self.requested.append(url)
+        self.timeouts.append(timeout)
+        return FakeResponse(url, self.pages.get(url, "<html></html>"))
+
+def test_parse_event_listing_reads_ids_titles_and_urls():
+    events = parse_event_listing(read(MONTH_VIEW), CALENDAR_URL)
+
+    assert [event["event_id"] for event in events] == EXPECTED_IDS
+    assert events[0]["title"] == "Women's Soccer Practice"
+    assert events[6]["title"] == "Rise & Ride (Cecilia)"
+    # Relative links are resolved and the event id is read from the link when the attribute is missing
+    assert events[3] == {"title": "WBB Practice", "event_id": "1313847853",
+                         "url": "https://25livepub.collegenet.com/calendars/25live-woodpec-cal?eventid=1313847853"}
+
+def test_find_listing_frames_resolves_sources():
+    frames = find_listing_frames(read(CALENDAR_PAGE), CALENDAR_URL)
+
+    assert frames == ["https://www.trumba.com/s.aspx?widget=header",
+                      "https://25livepub.collegenet.com/calendars/25live-woodpec-cal/tabs",
+                      "https://www.trumba.com/s.aspx?calendar=25live-woodpec-cal&widget=main"]
+
+def test_extract_event_urls_http_falls_back_to_iframes():
+    listing_url = "https://www.trumba.com/s.aspx?calendar=25live-woodpec-cal&widget=main"
+    session = FakeSession({CALENDAR_URL: read(CALENDAR_PAGE), listing_url: read(MONTH_VIEW)})
+
+    events = extract_event_urls_http(CALENDAR_URL, session)
+
+    assert [event["event_id"] for event in events] == EXPECTED_IDS
+    assert session.requested[0] == CALENDAR_URL
+    assert session.requested[-1] == listing_url
+
+def test_extract_events_from_saved_listing():
+    events = extract_events(CALENDAR_URL, "http", listing_html=MONTH_VIEW)
+
+    assert [event["event_id"] for event in events] == EXPECTED_IDS
+
+def test_listing_requests_are_bounded_by_the_deadline():
+    session = FakeSession({CALENDAR_URL: read(MONTH_VIEW)})
+    assert extract_event_urls_http(CALENDAR_URL, session, deadline=Deadline(0)) == []
+    assert session.requested == []
+
+    events = extract_event_urls_http(CALENDAR_URL, session, deadline=Deadline(5))
+    assert [event["event_id"] for event in events] == EXPECTED_IDS
+    assert 0 < session.timeouts[0] <= 5
+
+def test_events_are_dated_by_their_day_cell():
+    events = parse_event_listing(read(MONTH_VIEW), CALENDAR_URL, month_start=date(2025, 12, 1))
+
+    # The view opens on the last day of November
+    assert [event["listed_date"] for event in events] == ["2025-11-30", "2025-11-30", "2025-12-01", "2025-12-01",
+                                                          "2025-12-02", "2025-12-02", "2025-12-03"]
+    assert "listed_date" not in parse_event_listing(read(MONTH_VIEW), CALENDAR_URL)[0]
+
+def test_unfetched_events_are_ranked_by_listed_date():
+    today = date.today()
+
+    def listed(event_id, days, until_days=None):
+        event = {"title": "New event", "url": f"{CALENDAR_URL}?eventid={event_id}", "event_id": event_id,
+                 "listed_month": today.replace(day=1).isoformat(),
+                 "listed_date": (today + timedelta(days=days)).isoformat()}
+        if until_days is not None:
+            event["listed_until"] = (today + timedelta(days=until_days)).isoformat()
+        return event
+
+    events = [listed("later", PRIORITY_DAYS), listed("past", -3), listed("spanning", -3, until_days=2),
+              listed("soon", 1), listed("today", 0)]
+
+    ranked = prioritize_events(events, previous={})
+
+    assert [event["event_id"] for event in ranked] == ["spanning", "soon", "today", "later", "past"]